@@ -4,24 +4,160 @@ Obsługa zapisu i odczytu danych symulacji.
 ---
 Simulation data saving and loading utilities.
 """
-import json, datetime, os
-import xml.etree.ElementTree as ET
-import xml.dom.minidom
+import json, datetime, os, mmap, io, base64
+from functools import lru_cache
+from itertools import zip_longest
+from operator import itemgetter
 from pathlib import Path
-from openpyxl import Workbook, load_workbook
-from PyQt6.QtWidgets import QFileDialog, QMessageBox
 import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
-from tkinter import filedialog, messagebox, Listbox, MULTIPLE
-import tkinter as tk
 
-REQUIRED_USER_FIELDS = {
-    "material", "T0", "Tc", "mu", "fluence",
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_REQUIRED_NUMERIC = (
+    "T0", "Tc", "mu", "fluence",
     "pulse_duration", "laser_wavelength", "N", "asf"
-}
+)
+_REQUIRED_ALL = ("material",) + _REQUIRED_NUMERIC
+_pick_required = itemgetter(*_REQUIRED_ALL)
+
+REQUIRED_USER_FIELDS = frozenset(_REQUIRED_ALL)
+_REQUIRED_FIELDS_JOINED = ", ".join(_REQUIRED_ALL)
 
 ALLOWED_MATERIALS = ["Ni"]
+_ALLOWED_MATERIALS = frozenset(ALLOWED_MATERIALS)
+_ALLOWED_MATERIALS_JOINED = ", ".join(ALLOWED_MATERIALS)
+
+MMAP_THRESHOLD = 64 * 1024
+WRITE_BUFFER_SIZE = 1 << 20
+NPY_MIN_SIZE = 1024
+
+
+def _loads_json(data):
+    """
+    Parsuje dane JSON, korzystając z `orjson`, jeśli jest dostępny.
+
+    ---
+    Parses JSON data, using `orjson` when it is available.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=None)
+def _field_error(template, field):
+    """
+    Zwraca sformatowany komunikat błędu dla pola; wynik jest zapamiętywany
+    dla pary (szablon, pole), więc zmiana języka daje nowy wpis.
+
+    ---
+    Returns a formatted per-field error message, memoized per (template, field)
+    pair so that switching the language simply yields a new entry.
+    """
+    return template.format(field=field)
+
+
+def _read_json_file(file_path):
+    """
+    Wczytuje i parsuje plik JSON w trybie binarnym. Duże pliki są mapowane
+    do pamięci (mmap) i przekazywane do `orjson` bez kopiowania.
+
+    ---
+    Reads and parses a JSON file in binary mode. Large files are memory-mapped
+    and handed to `orjson` without an intermediate copy.
+    """
+    with open(file_path, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        return _loads_json(f.read())
+
+
+def encode_ndarray(array):
+    """
+    Zamienia tablicę NumPy na postać JSON. Małe tablice (i tablice obiektów) stają się
+    listami. Większe ciągłe tablice liczbowe zapisywane są jako surowy bufor w base64,
+    pozostałe jako blob NPY zakodowany w base64.
+
+    ---
+    Converts a NumPy array to a JSON-friendly value. Small (and object) arrays become
+    lists. Larger contiguous numeric arrays are stored as a raw base64 buffer,
+    the rest as a base64-encoded NPY blob.
+    """
+    if array.size <= NPY_MIN_SIZE or array.dtype.hasobject:
+        return array.tolist()
+    if array.flags.c_contiguous and array.dtype.kind in "fiuc":
+        return {
+            "__buf__": base64.b64encode(array.data).decode("ascii"),
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+        }
+    buf = io.BytesIO()
+    np.lib.format.write_array(buf, array, allow_pickle=False)
+    return {
+        "__npy__": base64.b64encode(buf.getvalue()).decode("ascii"),
+        "dtype": str(array.dtype),
+        "shape": list(array.shape),
+    }
+
+
+def decode_arrays(data):
+    """
+    Odtwarza tablice NumPy zapisane przez `encode_ndarray` w wczytanej strukturze JSON.
+
+    ---
+    Restores NumPy arrays written by `encode_ndarray` within loaded JSON data.
+    """
+    if isinstance(data, dict):
+        if "__buf__" in data:
+            raw = bytearray(base64.b64decode(data["__buf__"]))
+            return np.frombuffer(raw, dtype=np.dtype(data["dtype"])).reshape(data["shape"])
+        if "__npy__" in data:
+            raw = base64.b64decode(data["__npy__"])
+            return np.lib.format.read_array(io.BytesIO(raw), allow_pickle=False)
+        return {key: decode_arrays(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [decode_arrays(item) for item in data]
+    return data
+
+
+def load_simulation_arrays(file_path):
+    """
+    Wczytuje plik JSON zapisany z tablicami NumPy i odtwarza je przez `decode_arrays`.
+    Zwykłe pliki parametrów nie zawierają tablic, dlatego `load_simulation_parameters`
+    nie wykonuje tego kroku.
+
+    ---
+    Reads a JSON file saved with NumPy arrays and restores them via `decode_arrays`.
+    Plain parameter files hold no arrays, so `load_simulation_parameters` skips this step.
+    """
+    return decode_arrays(_read_json_file(file_path))
+
+
+def load_config(file_path):
+    """
+    Wczytuje plik konfiguracyjny JSON (np. tłumaczenia interfejsu).
+
+    Args:
+        file_path (str): Ścieżka do pliku .json
+
+    Returns:
+        dict: Zawartość pliku.
+
+    ---
+    Loads a JSON configuration file (e.g. UI translations).
+
+    Args:
+        file_path (str): Path to the .json file.
+
+    Returns:
+        dict: File contents.
+    """
+    with open(file_path, 'rb') as f:
+        return _loads_json(f.read())
 
 
 def generate_graph():
@@ -80,6 +216,10 @@ def generate_graph():
     Raises:
         Exception: If an error occurs while reading sheets or generating plots.
     """
+    import pandas as pd
+    import tkinter as tk
+    from tkinter import filedialog, messagebox, Listbox, MULTIPLE
+
     def select_file():
         filepath = filedialog.askopenfilename(filetypes=[("Excel files", "*.xlsx *.xls")])
         if not filepath:
@@ -95,6 +235,7 @@ def generate_graph():
 
             btn_generate.config(state="normal")
             root.filepath = filepath
+            root.excel = excel
             root.sheet_names = sheet_names
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load file: {e}")
@@ -107,18 +248,15 @@ def generate_graph():
 
         filepath = root.filepath
         selected_sheets = [root.sheet_names[i] for i in selected_indices]
-        dataframes = {}
 
         try:
-            for sheet in selected_sheets:
-                df = pd.read_excel(filepath, sheet_name=sheet, skiprows=4)
-                dataframes[sheet] = df
+            dataframes = pd.read_excel(root.excel, sheet_name=selected_sheets, skiprows=4)
         except Exception as e:
             messagebox.showerror("Error", f"Error while reading sheets: {e}")
             return
 
         try:
-            colors = plt.get_cmap("tab10")
+            from matplotlib.figure import Figure
 
             wykresy = [
                 (1, "M3TM Koopmans electrons", "M3TM_Koopmans_electrons.png"),
@@ -127,29 +265,29 @@ def generate_graph():
             ]
 
             for idx, (col_idx, tytul, filename) in enumerate(wykresy):
-                plt.figure(figsize=(10, 6))
+                # A bare Figure avoids pyplot's global figure manager and GUI backend.
+                fig = Figure(figsize=(10, 6))
+                ax = fig.add_subplot()
                 rysowano = False
 
                 for i, (sheet, df) in enumerate(dataframes.items()):
                     if df.shape[1] > col_idx:
-                        x = df.iloc[:, 0]
                         y = df.iloc[:, col_idx]
 
                         if pd.api.types.is_numeric_dtype(y):
-                            plt.plot(x, y, label=sheet, color=colors(i))
+                            ax.plot(df.iloc[:, 0].to_numpy(), y.to_numpy(), label=sheet, color=f"C{i}")
                             rysowano = True
 
                 if rysowano:
-                    plt.title(tytul)
-                    plt.xlabel("czas")
-                    plt.ylabel(tytul)
-                    plt.legend()
-                    plt.grid(True)
-                    plt.tight_layout()
+                    ax.set_title(tytul)
+                    ax.set_xlabel("czas")
+                    ax.set_ylabel(tytul)
+                    ax.legend()
+                    ax.grid(True)
+                    fig.tight_layout()
 
                     out_path = os.path.join(os.path.dirname(filepath), filename)
-                    plt.savefig(out_path)
-                plt.close()
+                    fig.savefig(out_path)
 
             messagebox.showinfo("Success", "Plots have been saved.")
         except Exception as e:
@@ -221,6 +359,8 @@ def save_simulation_to_excel(params, plot_data):
        Raises:
            Exception: If saving the file fails.
        """
+    from openpyxl import Workbook, load_workbook
+
     current_dir = Path.cwd()
     filename = current_dir / "Simulations.xlsx"
 
@@ -231,9 +371,8 @@ def save_simulation_to_excel(params, plot_data):
     if filename.exists():
         wb = load_workbook(filename)
     else:
-        wb = Workbook()
-        default_sheet = wb.active
-        wb.remove(default_sheet)
+        # A new workbook can be streamed row by row.
+        wb = Workbook(write_only=True)
 
     original_name = sheet_name
     counter = 1
@@ -243,38 +382,83 @@ def save_simulation_to_excel(params, plot_data):
 
     ws = wb.create_sheet(title=sheet_name)
 
-    parameter_keys = list(params.keys())
-    ws.append(parameter_keys)
-    parameter_values = [params[key] for key in parameter_keys]
-    ws.append(parameter_values)
+    ws.append(list(params))
+    ws.append(list(params.values()))
     ws.append([])
 
-    if 'lines' in plot_data:
-        max_len = 0
-        for line in plot_data['lines']:
-            max_len = max(max_len, len(line.get('x', [])))
-
-        col = 1
-        for i, line in enumerate(plot_data['lines']):
-            x_vals = line.get('x', [])
-            y_vals = line.get('y', [])
+    if plot_data.get('lines'):
+        lines = plot_data['lines']
+        width = 3 * len(lines) - 1
+        header = [None] * width
+        for i, line in enumerate(lines):
             title = line.get('title', f"Line {i + 1}")
+            header[3 * i] = f"{title} - x"
+            header[3 * i + 1] = f"{title} - y"
+        ws.append(header)
+
+        columns = [zip_longest(line.get('x', []), line.get('y', [])) for line in lines]
+        for points in zip_longest(*columns, fillvalue=(None, None)):
+            row = [None] * width
+            for i, (x, y) in enumerate(points):
+                row[3 * i] = x
+                row[3 * i + 1] = y
+            ws.append(row)
 
-            ws.cell(row=4, column=col, value=f"{title} - x")
-            ws.cell(row=4, column=col + 1, value=f"{title} - y")
+    wb.save(filename)
+    print(f"File saved to: {filename}, sheet: {sheet_name}")
 
-            for row_i in range(max_len):
-                x = x_vals[row_i] if row_i < len(x_vals) else None
-                y = y_vals[row_i] if row_i < len(y_vals) else None
-                ws.cell(row=5 + row_i, column=col, value=x)
-                ws.cell(row=5 + row_i, column=col + 1, value=y)
+def _emit_xml(parts, tag, data, pretty=True):
+    """
+    Zapisuje słowniki i listy jako tekst XML bezpośrednio do listy fragmentów,
+    bez budowania drzewa elementów (iteracyjnie, bez rekurencji).
 
-            col += 3
+    ---
+    Emits nested dicts and lists as XML text straight into a list of parts,
+    without building an element tree (iteratively, no recursion).
+    """
+    from xml.sax.saxutils import escape
+
+    newline = "\n" if pretty else ""
+    # Closing tags are pushed as plain strings between the pending children.
+    stack = [(tag, data, 0)]
+    while stack:
+        entry = stack.pop()
+        if type(entry) is str:
+            parts.append(entry)
+            continue
+
+        tag, value, depth = entry
+        pad = "  " * depth if pretty else ""
+        kind = type(value)
+        # Exact types are the common case; subclasses such as OrderedDict fall back to isinstance.
+        if kind is not dict and kind is not list and kind is not str:
+            if isinstance(value, dict):
+                kind = dict
+            elif isinstance(value, list):
+                kind = list
+        if kind is dict:
+            children = [(str(key), item) for key, item in value.items()]
+        elif kind is list:
+            children = [("item", item) for item in value]
+        else:
+            text = escape(str(value))
+            if text:
+                parts.append(f"{pad}<{tag}>{text}</{tag}>{newline}")
+            else:
+                parts.append(f"{pad}<{tag} />{newline}")
+            continue
 
-    wb.save(filename)
-    print(f"File saved to: {filename}, sheet: {sheet_name}")
+        if not children:
+            parts.append(f"{pad}<{tag} />{newline}")
+            continue
 
-def save_simulation_parameters(params, file_path, file_format, parameter_encoder, quantity_to_plain_func):
+        parts.append(f"{pad}<{tag}>{newline}")
+        stack.append(f"{pad}</{tag}>{newline}")
+        depth += 1
+        for child_tag, item in reversed(children):
+            stack.append((child_tag, item, depth))
+
+def save_simulation_parameters(params, file_path, file_format, parameter_encoder, quantity_to_plain_func, pretty=True):
     """
     Zapisuje dane symulacji w formacie JSON lub XML.
 
@@ -284,6 +468,8 @@ def save_simulation_parameters(params, file_path, file_format, parameter_encoder
         file_format (str): Format zapisu ("json" lub "xml").
         parameter_encoder (type): Niestandardowy encoder JSON.
         quantity_to_plain_func (callable): Funkcja konwertująca jednostki na wartości tekstowe.
+        pretty (bool, optional): Czy formatować plik wcięciami. Wyłącz dla plików
+                                 czytanych tylko maszynowo. Domyślnie True.
 
     Returns:
         str: Pełna ścieżka zapisanego pliku.
@@ -300,6 +486,8 @@ def save_simulation_parameters(params, file_path, file_format, parameter_encoder
         file_format (str): File format ("json" or "xml").
         parameter_encoder (type): Custom JSON encoder class.
         quantity_to_plain_func (callable): Function to convert quantities to plain values.
+        pretty (bool, optional): Whether to indent the output. Disable for files that are
+                                 only read by machines. Default is True.
 
     Returns:
         str: Full path to the saved file.
@@ -310,8 +498,19 @@ def save_simulation_parameters(params, file_path, file_format, parameter_encoder
     if file_format == "json":
         if not file_path.lower().endswith(".json"):
             file_path += ".json"
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(params, f, indent=2, ensure_ascii=False, cls=parameter_encoder)
+        if orjson is not None:
+            # Bez OPT_SERIALIZE_NUMPY tablice trafiają do `default` (encode_ndarray),
+            # więc oba silniki zapisują ten sam format.
+            # Without OPT_SERIALIZE_NUMPY arrays reach `default` (encode_ndarray),
+            # so both backends write the same format.
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            with open(file_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(orjson.dumps(params, default=parameter_encoder().default, option=option))
+        else:
+            with open(file_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                json.dump(params, f, indent=2 if pretty else None, cls=parameter_encoder)
         return file_path
 
     elif file_format == "xml":
@@ -319,26 +518,11 @@ def save_simulation_parameters(params, file_path, file_format, parameter_encoder
             file_path += ".xml"
 
         plain_params = quantity_to_plain_func(params)
-        root = ET.Element("simulation_parameters")
-
-        def add_dict_to_xml(parent, data):
-            if isinstance(data, dict):
-                for key, value in data.items():
-                    child = ET.SubElement(parent, str(key))
-                    add_dict_to_xml(child, value)
-            elif isinstance(data, list):
-                for item in data:
-                    item_elem = ET.SubElement(parent, "item")
-                    add_dict_to_xml(item_elem, item)
-            else:
-                parent.text = str(data)
+        parts = ['<?xml version="1.0" encoding="utf-8"?>\n']
+        _emit_xml(parts, "simulation_parameters", plain_params, pretty)
 
-        add_dict_to_xml(root, plain_params)
-
-        rough_string = ET.tostring(root, 'utf-8')
-        reparsed = xml.dom.minidom.parseString(rough_string)
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(reparsed.toprettyxml(indent="  "))
+        with open(file_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write("".join(parts))
 
         return file_path
 
@@ -373,35 +557,34 @@ def load_simulation_parameters(file_path,parent_widget):
            ValueError: If file or data is invalid.
        """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _read_json_file(file_path)
 
         if not isinstance(data, dict):
-            error_message_format = parent_widget.error_invalid_format.format(fields=", ".join(REQUIRED_USER_FIELDS))
+            error_message_format = parent_widget.error_invalid_format.format(fields=_REQUIRED_FIELDS_JOINED)
             raise ValueError(error_message_format)
 
-        missing = REQUIRED_USER_FIELDS - data.keys()
-        if missing:
+        if not REQUIRED_USER_FIELDS.issubset(data):
+            missing = REQUIRED_USER_FIELDS - data.keys()
             error_message = parent_widget.missing_fields_error.format(fields=", ".join(missing))
             raise ValueError(error_message)
 
-        for key in REQUIRED_USER_FIELDS:
-            if key == "material":
-                continue
-            value = data[key]
-            if not isinstance(value, (int, float)):
-                raise ValueError(parent_widget.error_invalid_type.format(field=key))
+        # Only the known keys are projected out of the parsed document.
+        values = _pick_required(data)
+        material = values[0]
+        for key, value in zip(_REQUIRED_NUMERIC, values[1:]):
+            if type(value) not in (int, float):
+                raise ValueError(_field_error(parent_widget.error_invalid_type, key))
+        user_data = dict(zip(_REQUIRED_ALL, values))
 
-        material = data.get("material")
-        if material not in ALLOWED_MATERIALS:
+        if material not in _ALLOWED_MATERIALS:
             raise ValueError(parent_widget.error_invalid_material.format(
                 material=material,
-                allowed=", ".join(ALLOWED_MATERIALS)
+                allowed=_ALLOWED_MATERIALS_JOINED
             ))
 
-        return {key: data[key] for key in REQUIRED_USER_FIELDS}
+        return user_data
 
-    except json.JSONDecodeError:
+    except json.JSONDecodeError:  # orjson.JSONDecodeError is a subclass
         raise ValueError(parent_widget.error_json_decode)
 
     except FileNotFoundError:
@@ -436,6 +619,8 @@ def save_simulation_report(params, material_name, material_props, plot_data, par
     Returns:
         None
     """
+    from PyQt6.QtWidgets import QFileDialog, QMessageBox
+
     file_path, selected_filter = QFileDialog.getSaveFileName(
         parent,
         "Save simulation report",
@@ -451,51 +636,53 @@ def save_simulation_report(params, material_name, material_props, plot_data, par
         file_path += ".txt"
 
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write("LaserDeMag simulation report\n")
-            f.write(f"Simulation date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            if simulation_duration is not None:
-                f.write(f"Simulation duration: {simulation_duration:.2f} seconds\n")
-            f.write("\n--- Simulation parameters ---\n")
-            for key, val in params.items():
-                f.write(f"{key}: {val}\n")
-
-            f.write(f"\n--- Material ---\n")
-            f.write(f"Name: {material_name}\n")
-            for prop_key, prop_val in material_props.items():
-                f.write(f"{prop_key}: {prop_val}\n")
-
-            f.write("\n--- Simulation results (selected data) ---\n")
-            if 'maps' in plot_data:
-                f.write("Data maps:\n")
-
-                maps = plot_data['maps']
-                delays = maps.get("delays", [])
-                distances = maps.get("distances", [])
-                temp_map = maps.get("temp_map", None)
-
-                f.write(f"  delays: {delays[:5]}... (total {len(delays)})\n")
-                f.write(f"  distances: {distances[:5]}... (total {len(distances)})\n")
-
-                if isinstance(temp_map, (list, np.ndarray)):
-                    arr = np.array(temp_map)
-                    f.write(f"  temp_map shape: {arr.shape} (time, space, component)\n")
-
-                    if arr.ndim == 3 and arr.shape[2] > 2:
-                        f.write("  Sample values (T_spin):\n")
-                        for t in range(min(2, arr.shape[0])):
-                            f.write(f"    {arr[t, :5, 2]}...\n")
-                else:
-                    f.write("  temp_map: missing or invalid format\n")
-
-            if 'lines' in plot_data:
-                f.write("Line plots:\n")
-                for i, d in enumerate(plot_data['lines']):
-                    f.write(f"  Line {i + 1} - {d.get('title', '')}:\n")
-                    f.write(f"    x: {d.get('x', [])[:5]}... (total {len(d.get('x', []))})\n")
-                    f.write(f"    y: {d.get('y', [])[:5]}... (total {len(d.get('y', []))})\n")
-
-            f.write("\n--- End of report ---\n")
+        parts = ["LaserDeMag simulation report\n",
+                 f"Simulation date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"]
+        if simulation_duration is not None:
+            parts.append(f"Simulation duration: {simulation_duration:.2f} seconds\n")
+        parts.append("\n--- Simulation parameters ---\n")
+        parts.append("".join(f"{key}: {val}\n" for key, val in params.items()))
+
+        parts.append("\n--- Material ---\n")
+        parts.append(f"Name: {material_name}\n")
+        parts.append("".join(f"{prop_key}: {prop_val}\n" for prop_key, prop_val in material_props.items()))
+
+        parts.append("\n--- Simulation results (selected data) ---\n")
+        if 'maps' in plot_data:
+            parts.append("Data maps:\n")
+
+            maps = plot_data['maps']
+            delays = maps.get("delays", [])
+            distances = maps.get("distances", [])
+            temp_map = maps.get("temp_map", None)
+
+            parts.append(f"  delays: {delays[:5]}... (total {len(delays)})\n")
+            parts.append(f"  distances: {distances[:5]}... (total {len(distances)})\n")
+
+            if isinstance(temp_map, (list, np.ndarray)):
+                arr = np.asarray(temp_map)
+                parts.append(f"  temp_map shape: {arr.shape} (time, space, component)\n")
+
+                if arr.ndim == 3 and arr.shape[2] > 2:
+                    parts.append("  Sample values (T_spin):\n")
+                    for t in range(min(2, arr.shape[0])):
+                        parts.append(f"    {np.array2string(arr[t, :5, 2], precision=6, separator=', ')}...\n")
+            else:
+                parts.append("  temp_map: missing or invalid format\n")
+
+        if 'lines' in plot_data:
+            parts.append("Line plots:\n")
+            for i, d in enumerate(plot_data['lines']):
+                parts.append(f"  Line {i + 1} - {d.get('title', '')}:\n")
+                xs = d.get('x', [])
+                ys = d.get('y', [])
+                parts.append(f"    x: {xs[:5]}... (total {len(xs)})\n")
+                parts.append(f"    y: {ys[:5]}... (total {len(ys)})\n")
+
+        parts.append("\n--- End of report ---\n")
+
+        with open(file_path, 'wb') as f:
+            f.write("".join(parts).encode('utf-8'))
 
         QMessageBox.information(
             parent,
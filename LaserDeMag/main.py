@@ -17,19 +17,45 @@ The `main` function executes the full simulation workflow based on input paramet
 - Runs the simulation using the prepared structure and parameters,
 - Returns simulation results for further processing or visualization.
 """
-from LaserDeMag.physics.model_3TM import get_material_properties, create_structure
-from LaserDeMag.simulation.runner import run_simulation
-def main(params):
+from functools import lru_cache
+
+
+@lru_cache(maxsize=32)
+def _prepare_structure(material, Tc, N):
+    """
+    Buduje (i zapamiętuje) strukturę dla danego materiału, Tc i liczby warstw
+    razem z użytymi właściwościami materiału.
+
+    ---
+    Builds (and memoizes) the structure for a given material, Tc and layer count
+    together with the material properties it was built from.
+    """
+    # udkm1Dsim (with sympy, scipy and pint) is loaded only when a simulation is run.
+    from LaserDeMag.physics.model_3TM import get_material_properties, create_structure
+
+    material_obj, prop = get_material_properties(material, Tc)
+    return create_structure(material_obj, prop, N), material_obj.name, prop
+
+
+def main(params, return_properties=False):
     """
     Run the full LaserDeMag simulation.
 
     Parameters:
         params (dict): Dictionary of user-defined simulation parameters.
+        return_properties (bool): Also return the material properties used to build the structure.
 
     Returns:
         dict: Results of the simulation (e.g., time delays, temperature maps).
+            With `return_properties=True` a `(results, properties)` tuple is returned.
     """
-    material_obj, prop = get_material_properties(params['material'], params['Tc'])
-    S = create_structure(material_obj, prop, params['N'])
-    material_name = material_obj.name
-    return run_simulation(S, params, material_name)
\ No newline at end of file
+    from LaserDeMag.physics.model_3TM import copy_material_properties
+    from LaserDeMag.simulation.runner import run_simulation
+
+    # Sweeps over fluence or pulse parameters reuse the same structure; the
+    # simulation only reads S, so sharing the cached instance is safe.
+    S, material_name, prop = _prepare_structure(params['material'], params['Tc'], params['N'])
+    result = run_simulation(S, params, material_name)
+    if return_properties:
+        return result, copy_material_properties(prop)
+    return result
\ No newline at end of file
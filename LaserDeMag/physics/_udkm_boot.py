@@ -0,0 +1,38 @@
+"""
+Jednorazowa inicjalizacja biblioteki `udkm1Dsim`.
+
+Podmienia `tqdm.notebook` na wersję terminalową przed importem `udkm1Dsim`,
+a następnie udostępnia moduł `ud` oraz rejestr jednostek `units`.
+Pozostałe moduły importują je stąd, dzięki czemu konfiguracja wykonywana jest raz.
+
+---
+One-time `udkm1Dsim` setup.
+
+Replaces `tqdm.notebook` with the terminal version before importing `udkm1Dsim`,
+then exposes the `ud` module and the `units` registry. Other modules import them
+from here so the setup runs exactly once.
+"""
+import sys
+import tqdm
+
+sys.modules['tqdm.notebook'] = tqdm
+import udkm1Dsim as ud
+
+units = ud.u
+
+
+def fake_notebook(*args, **kwargs):
+    """
+    Zastępuje funkcję `tqdm.notebook` wersją terminalową.
+
+    ---
+    Replaces `tqdm.notebook` with terminal-compatible `tqdm`.
+
+    Returns:
+        tqdm.tqdm instance
+    """
+    kwargs.setdefault('dynamic_ncols', True)
+    return tqdm.tqdm(*args, **kwargs)
+
+
+tqdm.tqdm_notebook = fake_notebook
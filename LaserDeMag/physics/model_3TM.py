@@ -1,4 +1,3 @@
-import sys, tqdm
 """
 Model fizyczny 3TM i właściwości materiałów.
 
@@ -9,27 +8,78 @@ Moduł wykorzystuje bibliotekę `udkm1Dsim` do budowy struktury i definicji para
 
 This module uses `udkm1Dsim` to construct the material structure and define parameters for the three-temperature model (3TM).
 """
-sys.modules['tqdm.notebook'] = tqdm
-import udkm1Dsim as ud
-units = ud.u
+from functools import lru_cache
+from typing import NamedTuple
+from LaserDeMag.physics._udkm_boot import ud, units
 
-units.setup_matplotlib()
-def fake_notebook(*args, **kwargs):
+# Compound units are built once; pint reduces them on every construction.
+_JKGK = units.J / units.kg / units.K
+_WMK = units.W / (units.m * units.K)
+_NMPS = units.nm / units.ps
+_KGM3 = units.kg / units.m ** 3
+
+class _Material(NamedTuple):
     """
-    Zastępuje funkcję `tqdm.notebook` wersją terminalową.
+    Stałe materiałowe modelu 3TM (jednostki SI, o ile nie zaznaczono inaczej).
 
     ---
-    Replaces `tqdm.notebook` with terminal-compatible `tqdm`.
+    3TM material constants (SI units unless noted otherwise).
+    """
+    g: float                # electron-phonon coupling, W/(m^3 K)
+    R: float                # spin-flip rate, 1/s
+    phonon_cp: float        # J/(kg K)
+    electron_k: float       # W/(m K)
+    phonon_k: float         # W/(m K)
+    density: float          # kg/m^3
+    lin_therm_exp: float    # 1/K
+    sound_vel: float        # nm/ps
+    opt_ref_index: complex
+
+
+_MATERIALS = {
+    'Ni': _Material(g=4.0e18, R=25.3 / 1e-12, phonon_cp=445, electron_k=15, phonon_k=90,
+                    density=8900, lin_therm_exp=11.8e-6, sound_vel=4.910,
+                    opt_ref_index=2.9174 + 3.3545j),
+}
+
+@lru_cache(maxsize=None)
+def _atom(symbol):
+    """
+    Zwraca współdzielony obiekt `ud.Atom` dla danego pierwiastka.
 
-    Returns:
-        tqdm.tqdm instance
+    ---
+    Returns a shared `ud.Atom` instance for the given element.
     """
-    kwargs.setdefault('dynamic_ncols', True)
-    return tqdm.tqdm(*args, **kwargs)
+    return ud.Atom(symbol)
 
-tqdm.tqdm_notebook = fake_notebook
-import udkm1Dsim as ud
-units = ud.u
+@lru_cache(maxsize=64)
+def _material_properties(material, Tc):
+    """
+    Buduje (i zapamiętuje) obiekt atomu oraz wzorcowy słownik właściwości materiału.
+    Wynik jest współdzielony, dlatego na zewnątrz udostępniany jest tylko przez kopię.
+
+    ---
+    Builds (and memoizes) the atom object and the template material property dict.
+    The result is shared, so it is only handed out as a copy.
+    """
+    try:
+        m = _MATERIALS[material]
+    except KeyError:
+        raise ValueError(f"Nieznany materiał: {material}") from None
+    material_obj = _atom(material)
+
+    prop = {
+        'heat_capacity': ['0.1*T', m.phonon_cp * _JKGK, 1 / m.density],
+        'therm_cond': [m.electron_k * _WMK, m.phonon_k * _WMK, 0],
+        'sub_system_coupling': ['-{:f}*(T_0-T_1)'.format(m.g),
+                                '{:f}*(T_0-T_1)'.format(m.g),
+                                '{0:f}*T_2*T_1*(1-T_2* (1 + 2/(exp({1:f}*T_2/T_0) - 1) ))'.format(m.R / Tc, 2 * Tc)],
+        'lin_therm_exp': [0, m.lin_therm_exp, 0],
+        'sound_vel': m.sound_vel * _NMPS,
+        'opt_ref_index': m.opt_ref_index,
+    }
+
+    return material_obj, prop
 
 def get_material_properties(material, Tc):
     """
@@ -59,26 +109,20 @@ def get_material_properties(material, Tc):
      Raises:
          ValueError: If material is not supported.
      """
-    if material == 'Ni':
-        material_obj = ud.Atom('Ni')
-    else:
-        raise ValueError(f"Nieznany materiał: {material}")
+    material_obj, prop = _material_properties(material, Tc)
+    return material_obj, copy_material_properties(prop)
 
-    g = 4.0e18
-    R = 25.3/1e-12
-
-    prop = {
-        'heat_capacity': ['0.1*T', 445 * units.J / units.kg / units.K, 1 / 8900],
-        'therm_cond': [15 * units.W / (units.m * units.K), 90 * units.W / (units.m * units.K), 0],
-        'sub_system_coupling': ['-{:f}*(T_0-T_1)'.format(g),
-                                '{:f}*(T_0-T_1)'.format(g),
-                                '{0:f}*T_2*T_1/{1:f}*(1-T_2* (1 + 2/(exp(2*T_2*{1:f}/T_0) - 1) ))'.format(R, Tc)],
-        'lin_therm_exp': [0, 11.8e-6, 0],
-        'sound_vel': 4.910 * units.nm / units.ps,
-        'opt_ref_index': 2.9174 + 3.3545j,
-    }
+def copy_material_properties(prop):
+    """
+    Zwraca kopię słownika właściwości z własnymi listami, aby zmiany nie psuły
+    kolejnych symulacji korzystających z zapamiętanych danych.
 
-    return material_obj, prop
+    ---
+    Returns a copy of the property dict with its own lists so mutations cannot
+    leak into later simulations that share the memoized data.
+    """
+    return {key: list(value) if isinstance(value, list) else value
+            for key, value in prop.items()}
 
 def create_structure(material_obj, prop,N):
     """
@@ -106,24 +150,24 @@ def create_structure(material_obj, prop,N):
     lattice_constant_Ni = 0.35241  # nm
     lattice_constant_Si = 0.5431   # nm
     N = int(N)
-    Si = ud.Atom('Si')
+    Si = _atom('Si')
     prop_Si = {}
-    prop_Si['heat_capacity'] = [100 * units.J / units.kg / units.K, 603 * units.J / units.kg / units.K, 1]
-    prop_Si['therm_cond'] = [0, 100 * units.W / (units.m * units.K), 0]
+    prop_Si['heat_capacity'] = [100 * _JKGK, 603 * _JKGK, 1]
+    prop_Si['therm_cond'] = [0, 100 * _WMK, 0]
 
     prop_Si['sub_system_coupling'] = [0, 0, 0]
 
     prop_Si['lin_therm_exp'] = [0, 2.6e-6, 0]
-    prop_Si['sound_vel'] = 8.433 * units.nm / units.ps
+    prop_Si['sound_vel'] = 8.433 * _NMPS
     prop_Si['opt_ref_index'] = 3.6941 + 0.0065435j
 
 
     layer = ud.AmorphousLayer(material_obj.name, material_obj.name, thickness=lattice_constant_Ni * units.nm,
-                              density=8900 * units.kg / units.m ** 3, atom=material_obj, **prop)
+                              density=8900 * _KGM3, atom=material_obj, **prop)
     structure = ud.Structure(material_obj.name)
     structure.add_sub_structure(layer, N)
 
-    layer_Si = ud.AmorphousLayer('Si', "Si amorphous", thickness=lattice_constant_Si * units.nm, density=2336 * units.kg / units.m ** 3,
+    layer_Si = ud.AmorphousLayer('Si', "Si amorphous", thickness=lattice_constant_Si * units.nm, density=2336 * _KGM3,
                                  atom=Si, **prop_Si)
     structure.add_sub_structure(layer_Si, 50)
     return structure
\ No newline at end of file
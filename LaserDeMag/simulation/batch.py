@@ -0,0 +1,82 @@
+"""
+Równoległe uruchamianie serii symulacji 3TM.
+
+Moduł udostępnia funkcję `run_batch`, która rozdziela niezależne zestawy parametrów
+(np. skan fluencji lub liczby warstw) pomiędzy procesy robocze.
+
+---
+Parallel execution of 3TM simulation series.
+
+This module provides `run_batch`, which distributes independent parameter sets
+(e.g. a fluence or layer-count scan) across worker processes.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+# Limity wątków bibliotek BLAS/OpenMP, odczytywane przy ich ładowaniu w procesie roboczym.
+# BLAS/OpenMP thread limits, read when those libraries load in a worker process.
+_THREAD_ENV_VARS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+
+
+def _init_worker():
+    """
+    Przygotowuje proces roboczy: wczesny import modułów fizyki.
+
+    ---
+    Prepares a worker process: an early import of the physics modules.
+    """
+    import LaserDeMag.physics.model_3TM  # noqa: F401
+    import LaserDeMag.simulation.runner  # noqa: F401
+
+
+def _run_one(params):
+    """
+    Uruchamia pojedynczą symulację w procesie roboczym.
+
+    ---
+    Runs a single simulation inside a worker process.
+    """
+    from LaserDeMag.main import main
+    return main(params)
+
+
+def run_batch(param_list, max_workers=None):
+    """
+    Uruchamia symulacje dla wielu zestawów parametrów równolegle,
+    z jednym wątkiem BLAS/OpenMP na proces roboczy.
+
+    Args:
+        param_list (iterable[dict]): Zestawy parametrów w formacie przyjmowanym przez `main`.
+        max_workers (int, optional): Liczba procesów roboczych. Domyślnie liczba rdzeni CPU.
+
+    Returns:
+        list[dict]: Wyniki symulacji w kolejności zestawów parametrów.
+
+    ---
+    Runs simulations for multiple parameter sets in parallel, one BLAS/OpenMP
+    thread per worker process.
+
+    Args:
+        param_list (iterable[dict]): Parameter sets in the format accepted by `main`.
+        max_workers (int, optional): Number of worker processes. Defaults to the CPU count.
+
+    Returns:
+        list[dict]: Simulation results in the order of the parameter sets.
+    """
+    # Procesy "spawn" startują bez załadowanego NumPy, więc dziedziczą limit jednego wątku
+    # ustawiony na czas pracy puli.
+    # "spawn" workers start without NumPy loaded, so they pick up the one-thread limit
+    # set for the lifetime of the pool.
+    saved = {name: os.environ.get(name) for name in _THREAD_ENV_VARS}
+    os.environ.update(dict.fromkeys(_THREAD_ENV_VARS, "1"))
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context("spawn"),
+                                 initializer=_init_worker) as executor:
+            return list(executor.map(_run_one, param_list))
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
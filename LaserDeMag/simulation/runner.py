@@ -10,14 +10,44 @@ oraz przygotowania danych do wizualizacji.
 This module includes a function that executes the full temperature distribution simulation using the 3TM model
 and prepares data for visualization.
 """
-import udkm1Dsim as ud
-units = ud.u
 import numpy as np
-
-units.setup_matplotlib()
+from LaserDeMag.physics._udkm_boot import ud, units
 from LaserDeMag.visual.plotter import plot_results
 
-units = ud.u
+# The delay grid is the same for every run.
+_DELAYS = np.arange(-0.1, 5.0, 0.005) * units.ps
+
+# Excitation units and fixed entries; udkm1Dsim expects quantities here.
+_MJ_CM2 = units.mJ / units.cm ** 2
+_DELAY_PUMP = [0] * units.ps
+_THETA = 45 * units.deg
+
+# Heat objects keyed by id(S); the structure is kept alongside to guard against id reuse.
+_HEAT_CACHE = {}
+_HEAT_CACHE_SIZE = 8
+
+
+def _get_heat(S):
+    """
+    Zwraca skonfigurowany obiekt `ud.Heat` dla struktury, tworząc go tylko raz.
+
+    ---
+    Returns a configured `ud.Heat` for the structure, building it only once.
+    """
+    entry = _HEAT_CACHE.get(id(S))
+    if entry is not None and entry[0] is S:
+        return entry[1]
+
+    h = ud.Heat(S, True)
+    h.save_data = False
+    h.disp_messages = True
+    h.heat_diffusion = True
+    h.boundary_conditions = {'top_type': 'isolator', 'bottom_type': 'isolator'}
+
+    if len(_HEAT_CACHE) >= _HEAT_CACHE_SIZE:
+        del _HEAT_CACHE[next(iter(_HEAT_CACHE))]
+    _HEAT_CACHE[id(S)] = (S, h)
+    return h
 
 def run_simulation(S, params,material_name):
     """
@@ -50,29 +80,29 @@ def run_simulation(S, params,material_name):
     Returns:
         dict: Data for plots (temperature maps and time graphs)
     """
-    h = ud.Heat(S, True)
-    h.save_data = False
-    h.disp_messages = True
-    h.heat_diffusion = True
+    T0 = params['T0']
+    fluence = params['fluence']
+    pulse_duration = params['pulse_duration']
+    laser_wavelength = params['laser_wavelength']
 
+    h = _get_heat(S)
     h.excitation = {
-        'fluence': [params['fluence']] * units.mJ / units.cm ** 2,
-        'delay_pump': [0] * units.ps,
-        'pulse_width': [params['pulse_duration'] * 1e-3] * units.ps,
+        'fluence': [fluence] * _MJ_CM2,
+        'delay_pump': _DELAY_PUMP,
+        'pulse_width': [pulse_duration * 1e-3] * units.ps,
         'multilayer_absorption': True,
-        'wavelength': params['laser_wavelength'] * units.nm,
-        'theta': 45 * units.deg
+        'wavelength': laser_wavelength * units.nm,
+        'theta': _THETA
     }
 
-    h.boundary_conditions = {'top_type': 'isolator', 'bottom_type': 'isolator'}
-    n = int(S.get_number_of_layers() -50)
-    init_temp = np.ones([S.get_number_of_layers(), 3])
-    init_temp[:, 0] = params['T0']
-    init_temp[:, 1] = params['T0']
-    init_temp[n:, 2] = 0
-
-    delays = np.r_[-0.1:5:0.005] * units.ps
-    _, _, distances = S.get_distances_of_layers()
+    num_layers = S.get_number_of_layers()
+    n = int(num_layers - 50)
+    init_temp = np.empty((num_layers, 3))
+    init_temp[:, :2] = T0
+    init_temp[:n, 2] = 1.0
+    init_temp[n:, 2] = 0.0
+
+    delays = _DELAYS
     temp_map, _ = h.get_temp_map(delays, init_temp)
 
     return plot_results(S, delays, temp_map, material_name)
@@ -34,19 +34,18 @@ This module uses PyQt6 for the interface and integrates simulation logic
 and data handling.
 """
 import json, os, time, sys
+from contextlib import contextmanager
+from functools import lru_cache
 import numpy as np
-from PyQt6.QtCore import QSize, Qt, QEvent, pyqtSignal, QPoint
-from PyQt6.QtGui import QPalette, QIcon, QColor, QFont, QPixmap
+from PyQt6.QtCore import QSize, Qt, QEvent, pyqtSignal, QPoint, QObject, QThread, QRunnable, QThreadPool
+from PyQt6.QtGui import QPalette, QIcon, QColor, QFont, QPixmap, QShortcut, QKeySequence
 from PyQt6.QtWidgets import (QApplication, QHBoxLayout, QLabel, QMainWindow, QToolButton, QVBoxLayout, QWidget,
                              QPushButton, QGroupBox, QGridLayout, QLineEdit, QComboBox, QFrame, QMessageBox,
                              QSizePolicy, QSplitter, QSpacerItem, QFileDialog, QDialog)
-from matplotlib import pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-from LaserDeMag.physics.model_3TM import get_material_properties
-from LaserDeMag.main import main
 from pint import Quantity
-from LaserDeMag.io.file_handler import save_simulation_parameters, load_simulation_parameters, save_simulation_report, save_simulation_to_excel, generate_graph
+from LaserDeMag.io.file_handler import save_simulation_parameters, load_simulation_parameters, save_simulation_report, save_simulation_to_excel, generate_graph, load_config, encode_ndarray
 
 if getattr(sys, 'frozen', False):
     sys.stdout = open(os.devnull, 'w')
@@ -77,6 +76,240 @@ def resource_path(relative_path):
         base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
     return os.path.join(base_path, relative_path)
 
+
+@lru_cache(maxsize=64)
+def _icon(relative_path):
+    """
+    Zwraca ikonę zasobu, wczytaną z dysku tylko przy pierwszym użyciu.
+
+    ---
+    Returns the resource icon, loaded from disk only on first use.
+    """
+    return QIcon(resource_path(relative_path))
+
+
+@lru_cache(maxsize=16)
+def _pixmap(relative_path, width, height):
+    """
+    Zwraca obraz zasobu przeskalowany do podanego rozmiaru (z pamięci podręcznej).
+
+    ---
+    Returns the resource image scaled to the given size (cached).
+    """
+    return QPixmap(resource_path(relative_path)).scaled(
+        width, height, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+    )
+
+MAX_LINE_POINTS = 4000
+
+# Wspólny wygląd okrągłych przycisków-ikon / shared look of the round icon buttons
+_TOOL_BUTTON_SIZE = QSize(30, 30)
+_TOOL_BUTTON_CSS = "border: none; background-color: transparent; border-radius: 15px;"
+
+# Arkusz stylów aplikacji, ustawiany raz przy starcie / application stylesheet, set once at start-up
+APP_STYLE = """
+    QToolTip {
+        color: white;
+        border: 1px solid black;
+        padding: 5px;
+        font-size: 12pt;
+    }
+"""
+
+# Arkusze stylów okna głównego dla obu motywów (widżety rozpoznawane po objectName)
+# Main window stylesheets for both themes (widgets matched by objectName)
+_LINE_EDIT_CSS = """
+    QLineEdit {
+        background-color: white;
+        color: black;
+        border: 1px solid gray;
+        border-radius: 4px;
+        padding: 2px 4px;
+    }
+"""
+_DARK_STYLE = _LINE_EDIT_CSS + """
+    QMessageBox {
+        background-color: black;
+        color: white;
+    }
+    QMessageBox QLabel {
+        color: white;
+        font-size: 14px;
+    }
+    QMessageBox QPushButton {
+        min-width: 80px;
+        padding: 5px;
+        background-color: black;
+        border: 1px solid white;
+    }
+    QGroupBox#formBox, QGroupBox#formBox QLabel, QLabel#titleLabel {
+        color: white;
+    }
+    QLabel#descriptionLabel {
+        color: white;
+        font-size: 12px;
+        margin-top: -5px;
+    }
+    QPushButton#formButton {
+        background-color: #444;
+        color: white;
+        border-radius: 5px;
+    }
+    QComboBox {
+        background-color: #2a2a2a;
+        color: white;
+        border: 1px solid #555;
+    }
+    QComboBox QAbstractItemView {
+        background-color: #3a3a3a;
+        color: white;
+        selection-background-color: #555;
+        selection-color: black;
+    }
+"""
+_LIGHT_STYLE = _LINE_EDIT_CSS + """
+    QMessageBox {
+        background-color: white;
+        color: black;
+    }
+    QMessageBox QLabel {
+        color: black;
+        font-size: 14px;
+    }
+    QMessageBox QPushButton {
+        min-width: 80px;
+        padding: 5px;
+    }
+    QGroupBox#formBox, QGroupBox#formBox QLabel, QLabel#titleLabel {
+        color: black;
+    }
+    QLabel#descriptionLabel {
+        color: black;
+        font-size: 12px;
+        margin-top: -5px;
+    }
+    QPushButton#formButton {
+        background-color: #ddd;
+        color: black;
+        border-radius: 5px;
+    }
+    QComboBox {
+        background-color: white;
+        color: black;
+        border: 1px solid gray;
+    }
+    QComboBox QAbstractItemView {
+        background-color: white;
+        color: black;
+        selection-background-color: #cce;
+        selection-color: black;
+    }
+"""
+
+# Domyślne (angielskie) komunikaty PlotCanvas, gdy brak tłumaczenia
+# Default (English) PlotCanvas messages used when a translation is missing
+_DEFAULT_PLOT_MESSAGES = {
+    'warning_title': 'Warning',
+    'warning_message': 'No plot data to save.',
+    'information_title': 'Information',
+    'information_message': 'All plots saved successfully.',
+    'critical_title': 'Critical Error',
+    'critical_message': 'Error saving all plots',
+    'fullscreen_title': 'Chart Fullscreen Preview',
+}
+
+# Indeksy przebiegów na kolejnych podwykresach wykresu liniowego
+# Trace indices drawn on each subplot of the line plot
+LINE_LAYOUT = ((0, 1), (2,))
+
+
+def _downsample(x, y, max_points=MAX_LINE_POINTS):
+    """
+    Redukuje liczbę punktów przebiegu, zachowując lokalne minima i maksima
+    (obwiednię) w każdym przedziale. Krótkie serie zwracane są bez zmian.
+
+    Args:
+        x (array-like): Wartości osi X.
+        y (array-like): Wartości osi Y.
+        max_points (int): Maksymalna liczba punktów po redukcji.
+
+    Returns:
+        tuple: Para tablic (x, y) do narysowania.
+
+    ---
+    Reduces the number of points in a trace while keeping the local minima and
+    maxima (the envelope) of each bucket. Short series are returned unchanged.
+
+    Args:
+        x (array-like): X-axis values.
+        y (array-like): Y-axis values.
+        max_points (int): Maximum number of points after reduction.
+
+    Returns:
+        tuple: Pair of arrays (x, y) to draw.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(y)
+    if n <= max_points:
+        return x, y
+
+    step = -(-n // ((max_points - 2) // 2))
+    buckets = n // step
+    offsets = np.arange(buckets) * step
+    end = buckets * step
+    blocks = y[:end].reshape(buckets, step)
+    parts = [[0], offsets + blocks.argmin(axis=1), offsets + blocks.argmax(axis=1), [n - 1]]
+    if end < n:
+        # Niepełny ostatni kubełek / trailing partial bucket
+        tail = y[end:]
+        parts.append([end + tail.argmin(), end + tail.argmax()])
+    idx = np.unique(np.concatenate(parts))
+    return x[idx], y[idx]
+
+
+# Kolory palet obu motywów (rola, RGB) / palette colours of both themes (role, RGB)
+_PALETTE_COLORS = {
+    'dark': (
+        (QPalette.ColorRole.Window, (53, 53, 53)),
+        (QPalette.ColorRole.WindowText, (255, 255, 255)),
+        (QPalette.ColorRole.Base, (42, 42, 42)),
+        (QPalette.ColorRole.AlternateBase, (66, 66, 66)),
+        (QPalette.ColorRole.ToolTipBase, (255, 255, 255)),
+        (QPalette.ColorRole.ToolTipText, (255, 255, 255)),
+        (QPalette.ColorRole.Text, (255, 255, 255)),
+        (QPalette.ColorRole.Button, (53, 53, 53)),
+        (QPalette.ColorRole.ButtonText, (255, 255, 255)),
+        (QPalette.ColorRole.BrightText, (255, 0, 0)),
+    ),
+    'light': (
+        (QPalette.ColorRole.Window, (240, 240, 240)),
+        (QPalette.ColorRole.WindowText, (0, 0, 0)),
+        (QPalette.ColorRole.Base, (255, 255, 255)),
+        (QPalette.ColorRole.AlternateBase, (220, 220, 220)),
+        (QPalette.ColorRole.ToolTipBase, (255, 255, 255)),
+        (QPalette.ColorRole.ToolTipText, (0, 0, 0)),
+        (QPalette.ColorRole.Text, (0, 0, 0)),
+        (QPalette.ColorRole.Button, (240, 240, 240)),
+        (QPalette.ColorRole.ButtonText, (0, 0, 0)),
+        (QPalette.ColorRole.BrightText, (255, 0, 0)),
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def _palette(theme):
+    """
+    Zwraca paletę kolorów motywu ('dark' lub 'light'), budowaną przy pierwszym użyciu.
+
+    ---
+    Returns the colour palette of a theme ('dark' or 'light'), built on first use.
+    """
+    palette = QPalette()
+    for role, rgb in _PALETTE_COLORS[theme]:
+        palette.setColor(role, QColor(*rgb))
+    return palette
+
 class LoadingDialog(QDialog):
     """
     Okno dialogowe wyświetlające komunikat ładowania z opcjonalnym obrazkiem.
@@ -110,12 +343,29 @@ class LoadingDialog(QDialog):
         if image_path:
             self.image_label = QLabel()
             self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            pixmap = QPixmap(image_path)
-            scaled_pixmap = pixmap.scaled(200, 200, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            self.image_label.setPixmap(scaled_pixmap)
+            self.image_label.setPixmap(_pixmap(image_path, 200, 200))
             layout.addWidget(self.image_label)
         self.setLayout(layout)
 
+class FullscreenPlotWindow(QMainWindow):
+    """
+    Okno pełnoekranowego podglądu wykresu. Zamykane klawiszem Esc;
+    po zamknięciu emituje sygnał `closed`.
+
+    ---
+    Fullscreen plot preview window. Closed with the Esc key;
+    emits the `closed` signal once closed.
+    """
+    closed = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        QShortcut(QKeySequence(Qt.Key.Key_Escape), self, activated=self.close)
+
+    def closeEvent(self, event):
+        super().closeEvent(event)
+        self.closed.emit()
+
 class ParameterEncoder(json.JSONEncoder):
     """
     Niestandardowy enkoder JSON dla obiektów używanych w aplikacji.
@@ -142,7 +392,7 @@ class ParameterEncoder(json.JSONEncoder):
         Obsługiwane typy:
         - Quantity (Pint): zwraca słownik z wartością i jednostką.
         - NumPy scalar: konwertuje na typ natywny Pythona.
-        - NumPy array: konwertuje na listę.
+        - NumPy array: konwertuje na listę (duże tablice na blob NPY w base64).
         - Complex: zwraca słownik z częścią rzeczywistą i urojoną.
         - Tuple: konwertuje na listę.
         - Inne: wywołuje metodę bazową `default`.
@@ -158,7 +408,7 @@ class ParameterEncoder(json.JSONEncoder):
         Supported types:
         - Quantity (Pint): returns a dict with value and unit.
         - NumPy scalar: converts to native Python type.
-        - NumPy array: converts to list.
+        - NumPy array: converts to list (large arrays to a base64 NPY blob).
         - Complex number: returns dict with real and imaginary parts.
         - Tuple: converts to list.
         - Others: calls base `default` method.
@@ -169,23 +419,32 @@ class ParameterEncoder(json.JSONEncoder):
         Returns:
             JSON-serializable object.
         """
-        # Pint Quantity
-        if isinstance(obj, Quantity):
-            return {"value": obj.magnitude, "unit": str(obj.units)}
-        # NumPy scalar
-        if isinstance(obj, (np.generic,)):
-            return obj.item()
-        # NumPy array
-        if isinstance(obj, np.ndarray):
-            return obj.tolist()
-        # Complex
-        if isinstance(obj, complex):
-            return {"real": obj.real, "imag": obj.imag}
-        # tuple -> list
-        if isinstance(obj, tuple):
-            return list(obj)
-        # everything else
-        return super().default(obj)
+        handler = _encoder_for(type(obj))
+        if handler is None:
+            return super().default(obj)
+        return handler(obj)
+
+
+@lru_cache(maxsize=None)
+def _encoder_for(cls):
+    """
+    Zwraca funkcję konwertującą obiekty danej klasy (wynik zapamiętywany per klasa).
+
+    ---
+    Returns the conversion function for objects of the given class (memoized per class).
+    """
+    # Pint creates a Quantity subclass per registry, hence issubclass rather than a dict on exact types.
+    if issubclass(cls, Quantity):
+        return lambda obj: {"value": obj.magnitude, "unit": str(obj.units)}
+    if issubclass(cls, np.generic):
+        return np.generic.item
+    if issubclass(cls, np.ndarray):
+        return encode_ndarray
+    if issubclass(cls, complex):
+        return lambda obj: {"real": obj.real, "imag": obj.imag}
+    if issubclass(cls, tuple):
+        return list
+    return None
 
 class PlotCanvas(FigureCanvas):
     """
@@ -222,9 +481,59 @@ class PlotCanvas(FigureCanvas):
         self.orig_parent = parent
         self.orig_layout = parent.layout() if parent else None
 
-        self.warning_message = ""
-        self.information_message = ""
-        self.critical_message = ""
+        self.update_messages({})
+
+        # Axes and artists of the layout currently on the figure; reused while
+        # the same layout is shown again so only the data has to be replaced.
+        self._layout = None
+        self._axes = []
+        self._artists = []
+        self._colorbars = []
+        self._map_coords = None
+        self._hover_cid = None
+        self._shown_data = None
+
+    def _reset_figure(self, layout):
+        """
+        Czyści figurę i zapamiętuje nowy układ wykresów.
+
+        ---
+        Clears the figure and records the new plot layout.
+        """
+        if self._hover_cid is not None:
+            self.mpl_disconnect(self._hover_cid)
+            self._hover_cid = None
+        self.fig.clf()
+        self._layout = layout
+        self._axes = []
+        self._artists = []
+        self._colorbars = []
+        self._map_coords = None
+        self._shown_data = None
+
+    def _is_shown(self, layout, data):
+        """
+        Sprawdza, czy dokładnie te dane są już narysowane w danym układzie.
+
+        ---
+        Checks whether exactly this data object is already drawn in the given layout.
+        """
+        return self._layout == layout and self._shown_data is data
+
+    @staticmethod
+    def _set_labels(ax, title, xlabel, ylabel):
+        """
+        Ustawia tytuł i opisy osi tylko wtedy, gdy się zmieniły.
+
+        ---
+        Sets the title and axis labels only when they changed.
+        """
+        if ax.get_title() != title:
+            ax.set_title(title)
+        if ax.get_xlabel() != xlabel:
+            ax.set_xlabel(xlabel)
+        if ax.get_ylabel() != ylabel:
+            ax.set_ylabel(ylabel)
 
     def clear(self):
         """
@@ -234,8 +543,8 @@ class PlotCanvas(FigureCanvas):
         Clears current plot data and redraws an empty plot.
         """
         self.plot_data = {}
-        self.fig.clf()
-        self.draw()
+        self._reset_figure(None)
+        self.draw_idle()
 
     def show_dimensional_effect_plot(self, dim_effect_data):
         """
@@ -253,48 +562,66 @@ class PlotCanvas(FigureCanvas):
         self.current_plot_type = "dimensional_effect"
         self.current_plot_index = 0
         self.plot_data["dim_effect"] = dim_effect_data
+        if self._is_shown("dimensional_effect", dim_effect_data):
+            return
 
-        self.fig.clf()
-        ax = self.fig.subplots(1, 1)
-
-        ax.plot(dim_effect_data["x"], dim_effect_data["y"], 'r-', label=dim_effect_data["label"])
-        sc = ax.scatter(dim_effect_data["x"], dim_effect_data["y"], color='red', s=40)
-        ax.set_xlabel(dim_effect_data["xlabel"])
-        ax.set_ylabel(dim_effect_data["ylabel"])
-        ax.set_title(dim_effect_data["title"])
-        ax.set_xlim(0, max(dim_effect_data["x"]) + 0.5)
-        ax.set_xticks(np.arange(0, 21, 5))
-        ax.legend()
-        ax.grid(True)
-
-        annot = ax.annotate(
-            "", xy=(0, 0), xytext=(-40, 20), textcoords="offset points",
-            bbox=dict(boxstyle="round", fc="w"),
-            arrowprops=dict(arrowstyle="->")
-        )
-        annot.set_visible(False)
-
-        def update_annot(ind):
-            pos = sc.get_offsets()[ind["ind"][0]]
-            annot.xy = pos
-            annot.set_text(f"{pos[1]:.2f}")
-            annot.get_bbox_patch().set_alpha(0.9)
-
-        def hover(event):
-            vis = annot.get_visible()
-            if event.inaxes == ax:
-                cont, ind = sc.contains(event)
-                if cont:
-                    update_annot(ind)
-                    annot.set_visible(True)
-                    self.fig.canvas.draw_idle()
-                elif vis:
-                    annot.set_visible(False)
-                    self.fig.canvas.draw_idle()
-
-        self.fig.canvas.mpl_connect("motion_notify_event", hover)
-
-        self.draw()
+        x = dim_effect_data["x"]
+        y = dim_effect_data["y"]
+
+        if self._layout != "dimensional_effect":
+            self._reset_figure("dimensional_effect")
+            ax = self.fig.subplots(1, 1)
+
+            line, = ax.plot(x, y, 'r-', label=dim_effect_data["label"])
+            sc = ax.scatter(x, y, color='red', s=40)
+            ax.set_xticks(np.arange(0, 21, 5))
+            ax.legend()
+            ax.grid(True)
+
+            annot = ax.annotate(
+                "", xy=(0, 0), xytext=(-40, 20), textcoords="offset points",
+                bbox=dict(boxstyle="round", fc="w"),
+                arrowprops=dict(arrowstyle="->")
+            )
+            annot.set_visible(False)
+
+            def update_annot(ind):
+                pos = sc.get_offsets()[ind["ind"][0]]
+                annot.xy = pos
+                annot.set_text(f"{pos[1]:.2f}")
+                annot.get_bbox_patch().set_alpha(0.9)
+
+            def hover(event):
+                vis = annot.get_visible()
+                if event.inaxes == ax:
+                    cont, ind = sc.contains(event)
+                    if cont:
+                        update_annot(ind)
+                        annot.set_visible(True)
+                        self.fig.canvas.draw_idle()
+                    elif vis:
+                        annot.set_visible(False)
+                        self.fig.canvas.draw_idle()
+
+            self._hover_cid = self.mpl_connect("motion_notify_event", hover)
+            self._axes = [ax]
+            self._artists = [line, sc]
+        else:
+            ax = self._axes[0]
+            line, sc = self._artists
+            line.set_data(x, y)
+            sc.set_offsets(np.column_stack((x, y)))
+            if line.get_label() != dim_effect_data["label"]:
+                line.set_label(dim_effect_data["label"])
+                ax.legend()
+            ax.relim()
+            ax.autoscale_view(scalex=False)
+
+        self._set_labels(ax, dim_effect_data["title"], dim_effect_data["xlabel"], dim_effect_data["ylabel"])
+        ax.set_xlim(0, max(x) + 0.5)
+
+        self._shown_data = dim_effect_data
+        self.draw_idle()
 
     def show_map_plot(self, map_data):
         """
@@ -313,28 +640,49 @@ class PlotCanvas(FigureCanvas):
         """
         self.current_plot_type = "map"
         self.current_plot_index = 0
-        self.fig.clf()
+        if self._is_shown("map", map_data):
+            return
 
         delays = map_data["delays"]
         distances = map_data["distances"]
         temp_map = map_data["temp_map"]
 
-        axs = self.fig.subplots(3, 1)
-        labels = ["Electrons", "Phonons", "Magnetization"]
-
-        for i in range(3):
-            pcm = axs[i].pcolormesh(
-                distances, delays, temp_map[:, :, i],
-                shading='auto',
-                cmap='inferno' if i < 2 else 'viridis'
-            )
-            self.fig.colorbar(pcm, ax=axs[i])
-            axs[i].set_xlabel("Distance [nm]")
-            axs[i].set_ylabel("Delay [ps]")
-            axs[i].set_title(f"Temperature Map {labels[i]}" if i < 2 else "Magnetization")
-
-        self.fig.tight_layout()
-        self.draw()
+        reuse = (
+            self._layout == "map"
+            and np.array_equal(self._map_coords[0], delays)
+            and np.array_equal(self._map_coords[1], distances)
+        )
+        if reuse:
+            # Same grid: swap the colour data and rescale each colour bar.
+            for i, (pcm, cbar) in enumerate(zip(self._artists, self._colorbars)):
+                pcm.set_array(temp_map[:, :, i])
+                pcm.autoscale()
+                cbar.update_normal(pcm)
+        else:
+            self._reset_figure("map")
+            # Wspólna oś odległości: etykieta X tylko na dolnym podwykresie.
+            # Shared distance axis: the X label is drawn on the bottom subplot only.
+            axs = self.fig.subplots(3, 1, sharex=True)
+            axs[-1].set_xlabel("Distance [nm]")
+            labels = ["Electrons", "Phonons", "Magnetization"]
+
+            for i in range(3):
+                pcm = axs[i].pcolormesh(
+                    distances, delays, temp_map[:, :, i],
+                    shading='auto',
+                    cmap='inferno' if i < 2 else 'viridis'
+                )
+                self._colorbars.append(self.fig.colorbar(pcm, ax=axs[i]))
+                self._artists.append(pcm)
+                axs[i].set_ylabel("Delay [ps]")
+                axs[i].set_title(f"Temperature Map {labels[i]}" if i < 2 else "Magnetization")
+
+            self._axes = list(axs)
+            self._map_coords = (delays, distances)
+            self.fig.tight_layout()
+
+        self._shown_data = map_data
+        self.draw_idle()
 
     def show_line_plot(self, line_data):
         """
@@ -354,21 +702,33 @@ class PlotCanvas(FigureCanvas):
         self.current_plot_type = "line"
         self.current_plot_index = 0
         self.plot_data["lines"] = line_data
-        self.fig.clf()
-        axs = self.fig.subplots(2, 1)
-        axs[0].plot(line_data[0]["x"], line_data[0]["y"], label=line_data[0]["label"])
-        axs[0].plot(line_data[1]["x"], line_data[1]["y"], label=line_data[1]["label"])
-        axs[0].set_title(line_data[0]["title"])
-        axs[0].set_xlabel(line_data[0]["xlabel"])
-        axs[0].set_ylabel(line_data[0]["ylabel"])
-        axs[0].legend()
-
-        axs[1].plot(line_data[2]["x"], line_data[2]["y"], label=line_data[2]["label"])
-        axs[1].set_title(line_data[2]["title"])
-        axs[1].set_xlabel(line_data[2]["xlabel"])
-        axs[1].set_ylabel(line_data[2]["ylabel"])
-        axs[1].legend()
-        self.draw()
+        if self._is_shown("line", line_data):
+            return
+
+        new_layout = self._layout != "line"
+        if new_layout:
+            self._reset_figure("line")
+            axs = self.fig.subplots(len(LINE_LAYOUT), 1)
+            self._axes = list(axs)
+            self._artists = [ax.plot([], [])[0] for ax, group in zip(axs, LINE_LAYOUT) for _ in group]
+
+        labels_changed = new_layout
+        for line, i in zip(self._artists, (i for group in LINE_LAYOUT for i in group)):
+            d = line_data[i]
+            line.set_data(*_downsample(d["x"], d["y"]))
+            if line.get_label() != d["label"]:
+                line.set_label(d["label"])
+                labels_changed = True
+
+        for ax, group in zip(self._axes, LINE_LAYOUT):
+            d = line_data[group[0]]
+            self._set_labels(ax, d["title"], d["xlabel"], d["ylabel"])
+            ax.relim()
+            ax.autoscale_view()
+            if labels_changed:
+                ax.legend()
+        self._shown_data = line_data
+        self.draw_idle()
 
     def save_current_plot(self, file_path):
         """
@@ -422,23 +782,24 @@ class PlotCanvas(FigureCanvas):
             if not hasattr(self, "plot_data") or not self.plot_data:
                 QMessageBox.warning(self, self.warning_message["title"], self.warning_message["message"])
                 return
-            line_groups = []
             lines = self.plot_data.get("lines", [])
-            if lines:
-                if len(lines) >= 3:
-                    line_groups.append(lines[0:2])
-                    line_groups.append([lines[2]])
-                else:
-                    line_groups.append(lines)
+            line_groups = [[lines[i] for i in group] for group in LINE_LAYOUT if max(group) < len(lines)]
+            if lines and not line_groups:
+                line_groups = [lines]
 
             map_data = self.plot_data.get("maps", [])
 
+            # One off-screen figure is cleared and resized for every exported plot.
+            fig = Figure()
+            default_size = fig.get_size_inches().copy()
+
             if map_data:
                 delays = map_data["delays"]
                 distances = map_data["distances"]
                 temp_map = map_data["temp_map"]
 
-                fig, axs = plt.subplots(3, 1, figsize=(6, 10))
+                fig.set_size_inches(6, 10)
+                axs = fig.subplots(3, 1)
                 labels = ["Electrons", "Phonons", "Magnetization"]
 
                 for i in range(3):
@@ -455,10 +816,11 @@ class PlotCanvas(FigureCanvas):
                 fig.tight_layout()
                 fig.subplots_adjust(hspace=0.4)
                 fig.savefig(os.path.join(directory, "plot_map.png"))
-                plt.close(fig)
 
             if line_groups:
-                fig, axs = plt.subplots(2, 1, figsize=(6, 8))
+                fig.clf()
+                fig.set_size_inches(6, 8)
+                axs = fig.subplots(len(line_groups), 1, squeeze=False)[:, 0]
                 for i, group in enumerate(line_groups):
                     for line in group:
                         axs[i].plot(line["x"], line["y"], label=line["label"])
@@ -469,33 +831,26 @@ class PlotCanvas(FigureCanvas):
                 fig.tight_layout()
                 fig.subplots_adjust(hspace=0.4)
                 fig.savefig(os.path.join(directory, "plot_line_grouped.png"))
-                plt.close(fig)
 
             dim_effect = self.plot_data.get("dim_effect")
             if dim_effect:
                 if isinstance(dim_effect, list):
-                    for idx, d in enumerate(dim_effect):
-                        fig, ax = plt.subplots()
-                        ax.plot(d["x"], d["y"], label=d("label", ""), color="red")
-                        ax.scatter(d["x"], d["y"], color="red", s=40)
-                        ax.set_title(d["title"])
-                        ax.set_xlabel(d["xlabel"])
-                        ax.set_ylabel(d["ylabel"])
-                        ax.legend()
-                        fig.tight_layout()
-                        fig.savefig(os.path.join(directory, f"plot_dim_effect_{idx}.png"))
-                        plt.close(fig)
+                    targets = [(d, f"plot_dim_effect_{idx}.png") for idx, d in enumerate(dim_effect)]
                 else:
-                    fig, ax = plt.subplots()
-                    ax.plot(dim_effect["x"], dim_effect["y"], label=dim_effect.get("label", ""), color="red")
-                    ax.scatter(dim_effect["x"], dim_effect["y"], color="red", s=40)
-                    ax.set_title(dim_effect["title"])
-                    ax.set_xlabel(dim_effect["xlabel"])
-                    ax.set_ylabel(dim_effect["ylabel"])
+                    targets = [(dim_effect, "plot_dim_effect.png")]
+
+                for d, filename in targets:
+                    fig.clf()
+                    fig.set_size_inches(default_size)
+                    ax = fig.subplots()
+                    ax.plot(d["x"], d["y"], label=d.get("label", ""), color="red")
+                    ax.scatter(d["x"], d["y"], color="red", s=40)
+                    ax.set_title(d["title"])
+                    ax.set_xlabel(d["xlabel"])
+                    ax.set_ylabel(d["ylabel"])
                     ax.legend()
                     fig.tight_layout()
-                    fig.savefig(os.path.join(directory, "plot_dim_effect.png"))
-                    plt.close(fig)
+                    fig.savefig(os.path.join(directory, filename))
 
             QMessageBox.information(self, self.information_message["title"], self.information_message["message"])
 
@@ -531,19 +886,11 @@ class PlotCanvas(FigureCanvas):
         Args:
             translations (dict): Dictionary with keys 'warning', 'info', 'critical'.
         """
-        self.warning_message = {
-            "title": translations.get('warning_title', 'Warning'),
-            "message": translations.get('warning_message', 'No plot data to save.')
-        }
-        self.information_message = {
-            "title": translations.get('information_title', 'Information'),
-            "message": translations.get('information_message', 'All plots saved successfully.')
-        }
-        self.critical_message = {
-            "title": translations.get('critical_title', 'Critical Error'),
-            "message": translations.get('critical_message', 'Error saving all plots')
-        }
-        self.fullscreen_title = translations.get('fullscreen_title', "Chart Fullscreen Preview")
+        t = {key: translations.get(key, default) for key, default in _DEFAULT_PLOT_MESSAGES.items()}
+        self.warning_message = {"title": t['warning_title'], "message": t['warning_message']}
+        self.information_message = {"title": t['information_title'], "message": t['information_message']}
+        self.critical_message = {"title": t['critical_title'], "message": t['critical_message']}
+        self.fullscreen_title = t['fullscreen_title']
 
     def show_warning(self):
         """
@@ -559,8 +906,8 @@ class PlotCanvas(FigureCanvas):
         """
         QMessageBox.warning(
             self,
-            "Warning",
-            self.warning_message
+            self.warning_message["title"],
+            self.warning_message["message"]
         )
 
     def show_information(self):
@@ -577,8 +924,8 @@ class PlotCanvas(FigureCanvas):
         """
         QMessageBox.information(
             self,
-            "Information",
-            self.information_message
+            self.information_message["title"],
+            self.information_message["message"]
         )
 
     def show_critical(self):
@@ -595,8 +942,8 @@ class PlotCanvas(FigureCanvas):
         """
         QMessageBox.critical(
             self,
-            "Critical Error",
-            self.critical_message
+            self.critical_message["title"],
+            self.critical_message["message"]
         )
 
     def open_current_plot_fullscreen(self):
@@ -610,33 +957,24 @@ class PlotCanvas(FigureCanvas):
             QMessageBox.warning(self, "Brak danych", "Brak danych wykresów do zapisu.")
             return
 
-        w = QMainWindow(self.orig_parent)
-        w.setWindowTitle(self.fullscreen_title)
-        w.showFullScreen()
-
-        full_canvas = PlotCanvas(parent=w)
-        full_canvas.plot_data = self.plot_data.copy()
-        full_canvas.current_plot_type = self.current_plot_type
-        full_canvas.current_plot_index = self.current_plot_index
-
-        if full_canvas.current_plot_type == "map":
-            full_canvas.show_map_plot(full_canvas.plot_data["maps"])
-        elif full_canvas.current_plot_type == "lines":
-            full_canvas.show_line_plot(full_canvas.plot_data["lines"])
-        else:
-            full_canvas.show_dimensional_effect_plot(full_canvas.plot_data["dim_effect"])
+        # Płótno jest przenoszone do okna pełnoekranowego zamiast rysowania wykresu od nowa.
+        # The canvas itself is moved into the fullscreen window instead of replotting.
+        index = self.orig_layout.indexOf(self) if self.orig_layout is not None else -1
+        if index < 0:
+            return
 
-        container = QWidget()
-        layout = QVBoxLayout(container)
-        layout.addWidget(full_canvas)
-        w.setCentralWidget(container)
+        w = FullscreenPlotWindow(self.orig_parent)
+        w.setWindowTitle(self.fullscreen_title)
+        w.setCentralWidget(self)
 
-        def on_key(event):
-            if event.key()  == 16777216:
-                w.close()
-        w.keyPressEvent = on_key
+        def restore():
+            w.takeCentralWidget()
+            self.orig_layout.insertWidget(index, self)
+            self.show()
+            w.deleteLater()
+        w.closed.connect(restore)
 
-        w.show()
+        w.showFullScreen()
 
 class CustomTitleBar(QWidget):
     """
@@ -670,10 +1008,52 @@ class CustomTitleBar(QWidget):
     """
     theme_changed = pyqtSignal(str)  # Sygnał do zmiany motywu
     info_clicked = pyqtSignal()
+
+    # (atrybut, klasa, ikona, podpowiedź, fabryka slotu) w kolejności na pasku
+    # (attribute, class, icon, tooltip, slot factory) in title bar order
+    _BUTTON_SPECS = (
+        ("info_button", QPushButton, 'resources/images/info_light.png', "Show info about this program",
+         lambda bar: bar.info_clicked.emit),
+        ("theme_switch_btn", QToolButton, 'resources/images/light_ui.png', "Change of color theme",
+         lambda bar: bar.toggle_theme),
+        ("polish_btn", QToolButton, 'resources/images/poland.png', "Change language to Polish",
+         lambda bar: lambda: bar.window().update_language("Polski")),
+        ("english_btn", QToolButton, 'resources/images/england.png', "Change language to English",
+         lambda bar: lambda: bar.window().update_language("English")),
+        ("minimize_btn", QToolButton, 'resources/images/minimize.png', None,
+         lambda bar: bar.window().showMinimized),
+        ("normal_button", QToolButton, 'resources/images/normal.png', None,
+         lambda bar: bar.window().showNormal),
+        ("maximize_btn", QToolButton, 'resources/images/maximize.png', None,
+         lambda bar: bar.window().showMaximized),
+        ("close_btn", QToolButton, 'resources/images/close.png', None,
+         lambda bar: bar.window().close),
+    )
+
+    _TITLE_CSS = """font-weight: bold;
+                   border: 2px solid {0};
+                   border-radius: 12px;
+                   margin: 2px;
+                   color: {0};
+                   background-color: transparent;
+                """
+    # Kolor tytułu to kolor tła palety poprzedniego motywu
+    # The title colour is the window colour of the previous theme's palette
+    _TITLE_STYLES = {
+        'dark': _TITLE_CSS.format('#f0f0f0'),
+        'light': _TITLE_CSS.format('#353535'),
+    }
+
     def __init__(self, parent):
         super().__init__(parent)
         self.setAutoFillBackground(True)
         self.initial_pos = None
+
+        # Bieżący motyw; MainWindow aktualizuje go przy bezpośredniej zmianie palety.
+        # Current theme; MainWindow keeps it in sync when it applies a palette directly.
+        window_color = QApplication.palette().color(QPalette.ColorRole.Window)
+        self.theme = 'light' if window_color.lightness() > 127 else 'dark'
+
         title_bar_layout = QHBoxLayout(self)
         title_bar_layout.setContentsMargins(5, 0, 5, 0)
         title_bar_layout.setSpacing(2)
@@ -684,71 +1064,19 @@ class CustomTitleBar(QWidget):
             self.title.setText(title)
         title_bar_layout.addWidget(self.title)
 
-        self.info_button = QPushButton()
-        self.info_button.setIcon(QIcon(resource_path('resources/images/info_light.png')))
-        self.info_button.setToolTip("Show info about this program")
-        self.info_button.setIconSize(QSize(32, 32))
-        self.info_button.setStyleSheet("border: none;")
-        self.info_button.clicked.connect(self.info_clicked.emit)
-
-        # Theme switch button
-        self.theme_switch_btn = QToolButton(self)
-        self.theme_switch_btn.setIcon(QIcon(resource_path('resources/images/light_ui.png')))
-        self.theme_switch_btn.setToolTip("Change of color theme")
-        self.theme_switch_btn.clicked.connect(self.toggle_theme)
-
-        # ENG button
-        self.english_btn = QToolButton(self)
-        self.english_btn.setIcon(QIcon(resource_path('resources/images/england.png')))
-        self.english_btn.setToolTip("Change language to English")
-        self.english_btn.clicked.connect(lambda: self.window().update_language("English"))
-
-        # PL button
-        self.polish_btn = QToolButton(self)
-        self.polish_btn.setIcon(QIcon(resource_path('resources/images/poland.png')))
-        self.polish_btn.setToolTip("Change language to Polish")
-        self.polish_btn.clicked.connect(lambda: self.window().update_language("Polski"))
-
-        # Min button
-        self.minimize_btn = QToolButton(self)
-        self.minimize_btn.setIcon(QIcon(resource_path('resources/images/minimize.png')))
-        self.minimize_btn.clicked.connect(self.window().showMinimized)
-
-        # Max button
-        self.maximize_btn = QToolButton(self)
-        self.maximize_btn.setIcon(QIcon(resource_path('resources/images/maximize.png')))
-        self.maximize_btn.clicked.connect(self.window().showMaximized)
-
-        # Close button
-        self.close_btn = QToolButton(self)
-        self.close_btn.setIcon(QIcon(resource_path('resources/images/close.png')))
-        self.close_btn.clicked.connect(self.window().close)
-
-        # Normal button
-        self.normal_button = QToolButton(self)
-        self.normal_button.setIcon(QIcon(resource_path('resources/images/normal.png')))
-        self.normal_button.clicked.connect(self.window().showNormal)
-        self.normal_button.setVisible(False)
-
-        # Add buttons
-        buttons = [
-            self.info_button,
-            self.theme_switch_btn,
-            self.polish_btn,
-            self.english_btn,
-            self.minimize_btn,
-            self.normal_button,
-            self.maximize_btn,
-            self.close_btn,
-        ]
-        for button in buttons:
+        for name, cls, icon, tooltip, slot in self._BUTTON_SPECS:
+            button = cls(self)
+            button.setIcon(_icon(icon))
+            if tooltip:
+                button.setToolTip(tooltip)
+            button.clicked.connect(slot(self))
             button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-            button.setFixedSize(QSize(30, 30))
-            button.setIconSize(QSize(30, 30))
-            button.setStyleSheet("border: none; background-color: transparent; border-radius: 15px;")
+            button.setFixedSize(_TOOL_BUTTON_SIZE)
+            button.setIconSize(_TOOL_BUTTON_SIZE)
+            button.setStyleSheet(_TOOL_BUTTON_CSS)
             title_bar_layout.addWidget(button)
-
-
+            setattr(self, name, button)
+        self.normal_button.setVisible(False)
 
     def mouseDoubleClickEvent(self, event):
         """
@@ -787,55 +1115,16 @@ class CustomTitleBar(QWidget):
         Returns:
             None
         """
-        app = QApplication.instance()
-        pal = QApplication.palette()
-        bg = pal.color(QPalette.ColorRole.Window).name()
-
-        if pal.color(QPalette.ColorRole.Window).lightness() > 127:
-            self.theme_changed.emit('dark')
-            self.theme_switch_btn.setIcon(QIcon(resource_path('resources/images/dark_ui.png')))
-            self.title.setStyleSheet(
-                f"""font-weight: bold;
-                   border: 2px solid {bg};
-                   border-radius: 12px;
-                   margin: 2px;
-                   color: {bg};
-                   background-color: transparent;
-                """
-            )
+        self.theme = 'dark' if self.theme == 'light' else 'light'
+        self.theme_changed.emit(self.theme)
+        if self.theme == 'dark':
+            self.theme_switch_btn.setIcon(_icon('resources/images/dark_ui.png'))
             self.setStyleSheet("background-color: #336699;")
-            self.info_button.setIcon(QIcon(resource_path('resources/images/info_dark.png')))
-            app.setStyleSheet("""
-                QToolTip {
-                    color: white;  
-                    border: 1px solid black; 
-                    padding: 5px;
-                    font-size: 12pt;
-                }
-            """)
-
-
+            self.info_button.setIcon(_icon('resources/images/info_dark.png'))
         else:
-            self.theme_changed.emit('light')
-            self.theme_switch_btn.setIcon(QIcon(resource_path('resources/images/light_ui.png')))
-            self.title.setStyleSheet(
-                f"""font-weight: bold;
-                   border: 2px solid {bg};
-                   border-radius: 12px;
-                   margin: 2px;
-                   color: {bg};
-                   background-color: transparent;
-                """
-            )
-            self.info_button.setIcon(QIcon(resource_path('resources/images/info_light.png')))
-            app.setStyleSheet("""
-                QToolTip {
-                    color: white;   
-                    border: 1px solid black; 
-                    padding: 5px;
-                    font-size: 12pt;
-                }
-            """)
+            self.theme_switch_btn.setIcon(_icon('resources/images/light_ui.png'))
+            self.info_button.setIcon(_icon('resources/images/info_light.png'))
+        self.title.setStyleSheet(self._TITLE_STYLES[self.theme])
 
     def window_state_changed(self, state):
         """
@@ -859,6 +1148,95 @@ class CustomTitleBar(QWidget):
             self.maximize_btn.setVisible(True)
 
 
+class TaskSignals(QObject):
+    """
+    Sygnały zadania wykonywanego w tle (`BackgroundTask`).
+
+    Sygnały:
+        finished(object): wynik zwrócony przez funkcję.
+        error(object): wyjątek zgłoszony przez funkcję.
+
+    ---
+    Signals of a background task (`BackgroundTask`).
+
+    Signals:
+        finished(object): value returned by the function.
+        error(object): exception raised by the function.
+    """
+    finished = pyqtSignal(object)
+    error = pyqtSignal(object)
+
+
+class BackgroundTask(QRunnable):
+    """
+    Wykonuje funkcję w puli wątków `QThreadPool` i zgłasza wynik przez `TaskSignals`.
+
+    Args:
+        fn (callable): Funkcja do wykonania.
+        *args, **kwargs: Argumenty przekazywane do funkcji.
+
+    ---
+    Runs a function on the `QThreadPool` and reports the outcome through `TaskSignals`.
+
+    Args:
+        fn (callable): Function to run.
+        *args, **kwargs: Arguments passed to the function.
+    """
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = TaskSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(e)
+        else:
+            self.signals.finished.emit(result)
+
+
+class SimulationWorker(QObject):
+    """
+    Wykonuje symulację poza wątkiem GUI i zwraca wynik przez sygnały.
+
+    Sygnały:
+        finished(object, object): dane wykresów oraz właściwości materiału.
+        error(object): wyjątek zgłoszony podczas symulacji.
+
+    ---
+    Runs the simulation off the GUI thread and reports back through signals.
+
+    Signals:
+        finished(object, object): plot data and material properties.
+        error(object): exception raised during the simulation.
+    """
+    finished = pyqtSignal(object, object)
+    error = pyqtSignal(object)
+
+    def __init__(self, params):
+        super().__init__()
+        self.params = params
+
+    def run(self):
+        """
+        Uruchamia symulację i emituje `finished` albo `error`.
+
+        ---
+        Runs the simulation and emits either `finished` or `error`.
+        """
+        try:
+            # Moduły fizyki importowane w wątku roboczym / physics modules imported on the worker thread
+            from LaserDeMag.main import main
+            result, prop = main(self.params, return_properties=True)
+        except Exception as e:
+            self.error.emit(e)
+        else:
+            self.finished.emit(result, prop)
+
+
 class MainWindow(QMainWindow):
     """
     Główne okno aplikacji LaserDeMag.
@@ -892,14 +1270,97 @@ class MainWindow(QMainWindow):
     - Plot area (PlotCanvas) with buttons for switching plots and downloading data.
     """
 
+    # Klucze tłumaczeń dla etykiet pól formularza / translation keys of the form field labels
+    _FIELD_LABEL_KEYS = (
+        ('init_temp_label', 'Initial temperature T0'),
+        ('curie_temp_label', 'Curie temperature TC'),
+        ('mag_moment_label', 'Magnetic moment μat'),
+        ('power_label', 'Power of impulse (mJ/cm²)'),
+        ('duration_label', 'Duration of the impulse (fs)'),
+        ('wavelength_label', 'Laser wavelength (nm)'),
+        ('n_label', 'Number of material layers (N)'),
+        ('asf_label', 'Spin-flip probability asf'),
+        ('material_label', 'Type of material'),
+    )
+    # Grupy formularza: (atrybut grupy, tytuł, wiersze (atrybut pola, klasa, atrybut etykiety, tekst))
+    # Form groups: (group attribute, title, rows (field attribute, class, label attribute, text))
+    _FORM_SPEC = (
+        ('material_box', "Material", (
+            ('material_type', QComboBox, 'material_label', "Select Material Type:"),
+            ('init_temp', QLineEdit, 'init_temp_label', "Initial Temperature:"),
+            ('curie_temp', QLineEdit, 'curie_temp_label', "Curie Temperature:"),
+            ('mag_moment', QLineEdit, 'mag_moment_label', "Magnetic Moment:"),
+        )),
+        ('laser_box', "Laser", (
+            ('power', QLineEdit, 'power_label', "Power (mJ/cm²):"),
+            ('duration', QLineEdit, 'duration_label', "Duration (fs):"),
+            ('wavelength', QLineEdit, 'wavelength_label', "Wavelength (nm):"),
+        )),
+        ('others_box', "Others", (
+            ('N', QLineEdit, 'n_label', "Number of material layers (N)"),
+            ('asf', QLineEdit, 'asf_label', "Spin-flip probability:"),
+        )),
+    )
+    # Parametry formularza: (klucz, pole, etykieta) / form parameters: (key, field, label)
+    _PARAM_FIELDS = (
+        ('T0', 'init_temp', 'init_temp_label'),
+        ('Tc', 'curie_temp', 'curie_temp_label'),
+        ('mu', 'mag_moment', 'mag_moment_label'),
+        ('fluence', 'power', 'power_label'),
+        ('pulse_duration', 'duration', 'duration_label'),
+        ('laser_wavelength', 'wavelength', 'wavelength_label'),
+        ('N', 'N', 'n_label'),
+        ('asf', 'asf', 'asf_label'),
+    )
+    # Pozostałe teksty widżetów / remaining widget texts
+    _TEXT_KEYS = (
+        ('title', 'LaserDeMag'),
+        ('description', 'Description'),
+        ('clear_btn', 'Clear fields'),
+        ('start_btn', 'Start the simulation'),
+    )
+    _BOX_TITLE_KEYS = (
+        ('material_box', 'Material'),
+        ('laser_box', 'Laser'),
+        ('others_box', 'Others'),
+    )
+    # Komunikaty zapisywane jako atrybuty o nazwie klucza / messages stored as attributes named after the key
+    _MESSAGE_KEYS = (
+        'missing_fields_error',
+        'error_invalid_format',
+        'error_json_decode',
+        'error_file_not_found',
+        'error_invalid_type',
+        'error_invalid_material',
+        'error_material_not_selected',
+        'error_invalid_number',
+        'error_required_field',
+        'information_title',
+        'critical_title',
+        'save_success_json',
+        'save_error_json',
+        'save_success_xml',
+        'save_error_xml',
+        'error_numerical_simulation',
+        'error_unknown_simulation',
+        'loading_message',
+        'loading_title',
+        'error_simulation_running',
+        'save_report_title',
+        'select_directory',
+        'save_plot',
+        'file_types',
+    )
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("LaserDeMag App")
         self.resize(1200, 900)
-        with open(resource_path('resources/translations/translations.json'),"r", encoding="utf-8") as f:
-            self.translations = json.load(f)
+        self.translations = load_config(resource_path('resources/translations/translations.json'))
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
         self.initial_pos = None
+        self._background_tasks = set()
+        self._simulation_thread = None
 
         central_widget = QWidget()
         main_layout = QHBoxLayout()
@@ -908,101 +1369,50 @@ class MainWindow(QMainWindow):
         self.title_bar.info_clicked.connect(self.show_info_message)
         self.title_bar.setFixedHeight(40)
         control_panel = QVBoxLayout()
-        self.widgets = {}
 
         header_layout = QHBoxLayout()
         self.logo_label = QLabel()
-        self.logo_pixmap = QPixmap(resource_path('resources/images/logo_light.png')).scaled(90, 90, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        self.logo_pixmap = _pixmap('resources/images/logo_light.png', 90, 90)
         self.logo_label.setPixmap(self.logo_pixmap)
-        self.widgets['title'] = QLabel("LaserDeMag")
-        self.widgets['title'].setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        self.title = QLabel("LaserDeMag")
+        self.title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        self.title.setObjectName("titleLabel")
 
         header_layout.addWidget(self.logo_label)
         header_layout.addSpacing(10)
-        header_layout.addWidget(self.widgets['title'])
-        header_layout.setAlignment(self.widgets['title'], Qt.AlignmentFlag.AlignVCenter)
+        header_layout.addWidget(self.title)
+        header_layout.setAlignment(self.title, Qt.AlignmentFlag.AlignVCenter)
         header_layout.addStretch()
 
-        self.widgets['description'] = QLabel("This is a simulation application.")
-        self.widgets['description'].adjustSize()
-        self.widgets['description'].setWordWrap(True)
-        self.widgets['description'].setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Maximum)
-        self.widgets['description'].setStyleSheet("color: gray; font-size: 12px; margin-top: -5px;")
+        self.description = QLabel("This is a simulation application.")
+        self.description.adjustSize()
+        self.description.setWordWrap(True)
+        self.description.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Maximum)
+        self.description.setObjectName("descriptionLabel")
 
         control_panel.addLayout(header_layout)
-        control_panel.addWidget(self.widgets['description'])
-
-        material_box = QGroupBox("Material")
-        material_layout = QGridLayout()
-        self.material_type = QComboBox()
-        material_layout.addWidget(QLabel("Select Material Type:"), 0, 0)
-        material_layout.addWidget(self.material_type, 0, 1)
-        self.widgets['material_label'] = material_layout.itemAtPosition(0, 0).widget()
-
-        self.init_temp = QLineEdit()
-        material_layout.addWidget(QLabel("Initial Temperature:"), 1, 0)
-        material_layout.addWidget(self.init_temp, 1, 1)
-        self.widgets['init_temp_label'] = material_layout.itemAtPosition(1, 0).widget()
-
-        self.curie_temp = QLineEdit()
-        material_layout.addWidget(QLabel("Curie Temperature:"), 2, 0)
-        material_layout.addWidget(self.curie_temp, 2, 1)
-        self.widgets['curie_temp_label'] = material_layout.itemAtPosition(2, 0).widget()
-
-        self.mag_moment = QLineEdit()
-        material_layout.addWidget(QLabel("Magnetic Moment:"), 3, 0)
-        material_layout.addWidget(self.mag_moment, 3, 1)
-        self.widgets['mag_moment_label'] = material_layout.itemAtPosition(3, 0).widget()
-        material_box.setLayout(material_layout)
-
-        laser_box = QGroupBox("Laser")
-        laser_layout = QGridLayout()
-        self.power = QLineEdit()
-        laser_layout.addWidget(QLabel("Power (mJ/cm²):"), 0, 0)
-        laser_layout.addWidget(self.power, 0, 1)
-        self.widgets['power_label'] = laser_layout.itemAtPosition(0, 0).widget()
-
-        self.duration = QLineEdit()
-        laser_layout.addWidget(QLabel("Duration (fs):"), 1, 0)
-        laser_layout.addWidget(self.duration, 1, 1)
-        self.widgets['duration_label'] = laser_layout.itemAtPosition(1, 0).widget()
-
-        self.wavelength = QLineEdit()
-        laser_layout.addWidget(QLabel("Wavelength (nm):"), 2, 0)
-        laser_layout.addWidget(self.wavelength, 2, 1)
-        self.widgets['wavelength_label'] = laser_layout.itemAtPosition(2, 0).widget()
-        laser_box.setLayout(laser_layout)
-
-        others_box = QGroupBox("Others")
-        others_layout = QGridLayout()
-        self.N = QLineEdit()
-        others_layout.addWidget(QLabel("Number of material layers (N)"), 0, 0)
-        others_layout.addWidget(self.N, 0, 1)
-        self.widgets['n_label'] = others_layout.itemAtPosition(0, 0).widget()
-
-        self.asf = QLineEdit()
-        others_layout.addWidget(QLabel("Spin-flip probability:"), 1, 0)
-        others_layout.addWidget(self.asf, 1, 1)
-        self.widgets['asf_label'] = others_layout.itemAtPosition(1, 0).widget()
-        others_box.setLayout(others_layout)
-
-        self.widgets['material_box'] = material_box
-        self.widgets['laser_box'] = laser_box
-        self.widgets['others_box'] = others_box
+        control_panel.addWidget(self.description)
+
+        for box_attr, box_title, rows in self._FORM_SPEC:
+            setattr(self, box_attr, self._build_form(box_title, rows))
+
+        self._all_fields = tuple(getattr(self, attr) for _, attr, _ in self._PARAM_FIELDS)
 
         self.load_from_file_btn = QToolButton()
-        self.load_from_file_btn.setIcon(QIcon(resource_path('resources/images/from_file_light.png')))
+        self.load_from_file_btn.setIcon(_icon('resources/images/from_file_light.png'))
         self.load_from_file_btn.setToolTip("Load data from file")
-        self.widgets['clear_btn'] = QPushButton("Clear Fields")
-        self.widgets['start_btn'] = QPushButton("Start Simulation")
+        self.clear_btn = QPushButton("Clear Fields")
+        self.start_btn = QPushButton("Start Simulation")
+        self.clear_btn.setObjectName("formButton")
+        self.start_btn.setObjectName("formButton")
         btn_layout = QHBoxLayout()
         btn_layout.addWidget(self.load_from_file_btn)
-        btn_layout.addWidget(self.widgets['clear_btn'])
-        btn_layout.addWidget(self.widgets['start_btn'])
+        btn_layout.addWidget(self.clear_btn)
+        btn_layout.addWidget(self.start_btn)
 
-        control_panel.addWidget(material_box)
-        control_panel.addWidget(laser_box)
-        control_panel.addWidget(others_box)
+        control_panel.addWidget(self.material_box)
+        control_panel.addWidget(self.laser_box)
+        control_panel.addWidget(self.others_box)
         control_panel.addLayout(btn_layout)
 
         self.plot_frame = QFrame()
@@ -1016,33 +1426,29 @@ class MainWindow(QMainWindow):
         buttons_panel = QVBoxLayout()
         switch_plot_layout = QVBoxLayout()
         self.up_arrow_btn = QToolButton()
-        self.up_arrow_btn.setIcon(QIcon(resource_path('resources/images/up_light.png')))
+        self.up_arrow_btn.setIcon(_icon('resources/images/up_light.png'))
         self.up_arrow_btn.setToolTip("Show next chart")
         self.down_arrow_btn = QToolButton()
-        self.down_arrow_btn.setIcon(QIcon(resource_path('resources/images/down_light.png')))
+        self.down_arrow_btn.setIcon(_icon('resources/images/down_light.png'))
         self.down_arrow_btn.setToolTip("Show previous chart")
         switch_plot_layout.addWidget(self.up_arrow_btn)
         switch_plot_layout.addWidget(self.down_arrow_btn)
 
         download_layout = QVBoxLayout()
         self.download_current_btn = QToolButton()
-        self.download_current_btn.setIcon(QIcon(resource_path('resources/images/download_photo_light.png')))
+        self.download_current_btn.setIcon(_icon('resources/images/download_photo_light.png'))
         self.download_current_btn.setToolTip("Download current chart")
-        self.download_current_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        self.download_current_btn.setFixedSize(QSize(30, 30))
-        self.download_current_btn.setIconSize(QSize(30, 30))
-        self.download_current_btn.setStyleSheet("border: none; background-color: transparent; border-radius: 15px;")
         self.download_all_btn = QToolButton()
-        self.download_all_btn.setIcon(QIcon(resource_path('resources/images/download_all_light.png')))
+        self.download_all_btn.setIcon(_icon('resources/images/download_all_light.png'))
         self.download_all_btn.setToolTip("Download all charts")
         self.download_data_btn = QToolButton()
-        self.download_data_btn.setIcon(QIcon(resource_path('resources/images/download_data_light.png')))
+        self.download_data_btn.setIcon(_icon('resources/images/download_data_light.png'))
         self.download_data_btn.setToolTip("Download data charts")
         self.zoom_btn = QToolButton()
-        self.zoom_btn.setIcon(QIcon(resource_path('resources/images/maxGraph_light.png')))
+        self.zoom_btn.setIcon(_icon('resources/images/maxGraph_light.png'))
         self.zoom_btn.setToolTip("Zoom to max graph")
         self.generate_graph_btn = QToolButton()
-        self.generate_graph_btn.setIcon(QIcon(resource_path('resources/images/graph_light.png')))
+        self.generate_graph_btn.setIcon(_icon('resources/images/graph_light.png'))
         self.generate_graph_btn.setToolTip("Generate graphs based on Excel data")
 
         download_layout.addWidget(self.generate_graph_btn)
@@ -1080,13 +1486,20 @@ class MainWindow(QMainWindow):
         main_container.setLayout(title_bar_layout)
         self.setCentralWidget(main_container)
 
+        # Styl przycisków-ikon nie zależy od motywu / the icon button style does not depend on the theme
+        for button in self.findChildren(QToolButton):
+            button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+            button.setFixedSize(_TOOL_BUTTON_SIZE)
+            button.setIconSize(_TOOL_BUTTON_SIZE)
+            button.setStyleSheet(_TOOL_BUTTON_CSS)
+
         self.title_bar.theme_changed.connect(self.change_theme)
 
         self.update_language("English")
 
         self.load_from_file_btn.clicked.connect(self.load_user_data)
-        self.widgets['clear_btn'].clicked.connect(self.clear_fields)
-        self.widgets['start_btn'].clicked.connect(self.start_simulation)
+        self.clear_btn.clicked.connect(self.clear_fields)
+        self.start_btn.clicked.connect(self.start_simulation)
 
         self.up_arrow_btn.clicked.connect(self.switch_plot_up)
         self.down_arrow_btn.clicked.connect(self.switch_plot_down)
@@ -1096,6 +1509,26 @@ class MainWindow(QMainWindow):
         self.zoom_btn.clicked.connect(self.zoom_plot)
         self.generate_graph_btn.clicked.connect(generate_graph)
 
+    def _build_form(self, title, rows):
+        """
+        Tworzy grupę formularza z etykietami i polami w siatce; pola i etykiety
+        zapisywane są jako atrybuty okna.
+
+        Builds a form group with labels and fields in a grid; fields and labels
+        are stored as window attributes.
+        """
+        box = QGroupBox(title)
+        box.setObjectName("formBox")
+        layout = QGridLayout(box)
+        for row, (field_attr, field_cls, label_attr, text) in enumerate(rows):
+            label = QLabel(text)
+            field = field_cls()
+            layout.addWidget(label, row, 0)
+            layout.addWidget(field, row, 1)
+            setattr(self, label_attr, label)
+            setattr(self, field_attr, field)
+        return box
+
     def show_info_message(self):
         """
         Wyświetla okno dialogowe z informacjami o aplikacji.
@@ -1140,11 +1573,15 @@ class MainWindow(QMainWindow):
 
         Jeśli lewy przycisk i okno jest zmaksymalizowane, przywraca do rozmiaru normalnego
         i zapisuje pozycję kliknięcia, by umożliwić płynne przeciąganie.
+        W przeciwnym razie przeciąganie przekazywane jest systemowi okien (`startSystemMove`),
+        a ręczne przesuwanie pozostaje awaryjnym rozwiązaniem.
 
         Handles mouse press events.
 
         If left button is pressed and window is maximized, restores to normal size
         and records click position to enable smooth dragging.
+        Otherwise the drag is handed to the window system (`startSystemMove`),
+        with manual moving kept as a fallback.
         """
         if event.button() == Qt.MouseButton.LeftButton:
             if self.isMaximized():
@@ -1154,6 +1591,8 @@ class MainWindow(QMainWindow):
                 click_x = global_pos.x() - geo.x()
                 click_y = global_pos.y() - geo.y()
                 self.initial_pos = QPoint(click_x, click_y)
+            elif self.windowHandle() is not None and self.windowHandle().startSystemMove():
+                self.initial_pos = None
             else:
                 self.initial_pos = event.position().toPoint()
 
@@ -1207,11 +1646,12 @@ class MainWindow(QMainWindow):
 
         Also clears the plot area if it exists.
         """
-        for field in [self.init_temp, self.curie_temp, self.mag_moment,
-                      self.power, self.duration, self.wavelength,
-                      self.N, self.asf]:
-            field.clear()
-        self.material_type.setCurrentIndex(0)
+        with self._updates_suspended():
+            for field in self._all_fields:
+                blocked = field.blockSignals(True)
+                field.clear()
+                field.blockSignals(blocked)
+            self.material_type.setCurrentIndex(0)
         if hasattr(self, 'plot_canvas'):
             self.plot_canvas.clear()
 
@@ -1235,59 +1675,16 @@ class MainWindow(QMainWindow):
         """
         self.current_language = lang
         t = self.translations[lang]
-        self.field_labels = {
-            'init_temp_label': t['Initial temperature T0'],
-            'curie_temp_label': t['Curie temperature TC'],
-            'mag_moment_label': t['Magnetic moment μat'],
-            'power_label': t['Power of impulse (mJ/cm²)'],
-            'duration_label': t['Duration of the impulse (fs)'],
-            'wavelength_label': t['Laser wavelength (nm)'],
-            'n_label': t['Number of material layers (N)'],
-            'asf_label': t['Spin-flip probability asf'],
-            'material_label': t['Type of material'],
-        }
-        self.widgets['title'].setText(t['LaserDeMag'])
-        self.widgets['description'].setText(t['Description'])
-        self.widgets['material_box'].setTitle(t['Material'])
-        self.widgets['material_label'].setText(t['Type of material'])
+        self.field_labels = {name: t[key] for name, key in self._FIELD_LABEL_KEYS}
+        for name, key in self._FIELD_LABEL_KEYS + self._TEXT_KEYS:
+            getattr(self, name).setText(t[key])
+        for name, key in self._BOX_TITLE_KEYS:
+            getattr(self, name).setTitle(t[key])
         self.material_type.clear()
         self.material_type.addItems([t['Select the type'], "Ni"])
-        self.widgets['init_temp_label'].setText(t['Initial temperature T0'])
-        self.widgets['curie_temp_label'].setText(t['Curie temperature TC'])
-        self.widgets['mag_moment_label'].setText(t['Magnetic moment μat'])
-        self.widgets['laser_box'].setTitle(t['Laser'])
-        self.widgets['power_label'].setText(t['Power of impulse (mJ/cm²)'])
-        self.widgets['duration_label'].setText(t['Duration of the impulse (fs)'])
-        self.widgets['wavelength_label'].setText(t['Laser wavelength (nm)'])
-        self.widgets['others_box'].setTitle(t['Others'])
-        self.widgets['n_label'].setText(t['Number of material layers (N)'])
-        self.widgets['asf_label'].setText(t['Spin-flip probability asf'])
-        self.widgets['clear_btn'].setText(t['Clear fields'])
-        self.widgets['start_btn'].setText(t['Start the simulation'])
         self.plot_canvas.update_messages(t)
-        self.missing_fields_error = t['missing_fields_error']
-        self.error_invalid_format = t['error_invalid_format']
-        self.error_json_decode = t['error_json_decode']
-        self.error_file_not_found = t['error_file_not_found']
-        self.error_invalid_type= t['error_invalid_type']
-        self.error_invalid_material= t['error_invalid_material']
-        self.error_material_not_selected = t['error_material_not_selected']
-        self.error_invalid_number = t['error_invalid_number']
-        self.error_required_field = t['error_required_field']
-        self.information_title = t['information_title']
-        self.critical_title = t['critical_title']
-        self.save_success_json = t['save_success_json']
-        self.save_error_json = t['save_error_json']
-        self.save_success_xml = t['save_success_xml']
-        self.save_error_xml = t['save_error_xml']
-        self.error_numerical_simulation = t['error_numerical_simulation']
-        self.error_unknown_simulation = t['error_unknown_simulation']
-        self.loading_message = t['loading_message']
-        self.loading_title = t['loading_title']
-        self.save_report_title = t['save_report_title']
-        self.select_directory = t['select_directory']
-        self.save_plot = t['save_plot']
-        self.file_types = t['file_types']
+        for key in self._MESSAGE_KEYS:
+            setattr(self, key, t[key])
 
     def change_theme(self, theme: str):
         """
@@ -1306,6 +1703,20 @@ class MainWindow(QMainWindow):
         elif theme == 'light':
             self.set_light_ui()
 
+    @contextmanager
+    def _updates_suspended(self):
+        """
+        Wstrzymuje odświeżanie okna na czas serii zmian stylu i odświeża je raz na końcu.
+
+        Suspends window updates during a series of style changes and repaints once at the end.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+
     def set_dark_ui(self):
         """
         Ustawia ciemny motyw interfejsu użytkownika,
@@ -1314,93 +1725,28 @@ class MainWindow(QMainWindow):
         Sets the dark UI theme by changing text colors, icons,
         and the application color palette.
         """
-        self.widgets['material_box'].setStyleSheet("color: white;")
-        self.widgets['laser_box'].setStyleSheet("color: white;")
-        self.widgets['others_box'].setStyleSheet("color: white;")
-        self.widgets['description'].setStyleSheet("color: white;")
-        self.widgets['title'].setStyleSheet("color: white;")
-        new_logo = QPixmap(resource_path('resources/images/logo_dark.png')).scaled(90, 90, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-        self.logo_label.setPixmap(new_logo)
-        self.download_current_btn.setIcon(QIcon(resource_path('resources/images/download_photo_dark.png')))
-        self.download_data_btn.setIcon(QIcon(resource_path('resources/images/download_data_dark.png')))
-        self.zoom_btn.setIcon(QIcon(resource_path('resources/images/maxGraph_dark.png')))
-        self.down_arrow_btn.setIcon(QIcon(resource_path('resources/images/down_dark.png')))
-        self.up_arrow_btn.setIcon(QIcon(resource_path('resources/images/up_dark.png')))
-        self.download_all_btn.setIcon(QIcon(resource_path('resources/images/download_all_dark.png')))
-        self.load_from_file_btn.setIcon(QIcon(resource_path('resources/images/from_file_dark.png')))
-        self.image_path = resource_path('resources/images/loading_dark.png')
-        self.generate_graph_btn.setIcon(QIcon(resource_path('resources/images/graph_dark.png')))
-
-        for le in self.centralWidget().findChildren(QLineEdit):
-            le.setStyleSheet("""
-                QLineEdit {
-                    background-color: white;
-                    color: black;
-                    border: 1px solid gray;
-                    border-radius: 4px;
-                    padding: 2px 4px;
-                }
-            """)
-
-        for cb in self.findChildren(QComboBox):
-            cb.setStyleSheet("""
-                        QComboBox {
-                            background-color: #2a2a2a;
-                            color: white;
-                            border: 1px solid #555;
-                        }
-                        QComboBox QAbstractItemView {
-                            background-color: #3a3a3a;
-                            color: white;
-                            selection-background-color: #555;
-                            selection-color: black;
-                        }
-                    """)
-        QApplication.instance().setStyleSheet("""
-            QMessageBox {
-                background-color: black;
-                color: white;
-            }
-            QMessageBox QLabel {
-                color: white;
-                font-size: 14px;
-            }
-            QMessageBox QPushButton {
-                min-width: 80px;
-                padding: 5px;
-                background-color: black;
-                border:1px solid white;
-            }
-        """)
-
-        for button in self.findChildren(QToolButton):
-            button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-            button.setFixedSize(QSize(30, 30))
-            button.setIconSize(QSize(30, 30))
-            button.setStyleSheet("""
-                       border: none;
-                       background-color: transparent;
-                       border-radius: 15px;
-        """)
-
-        # Buttons
-        self.widgets['clear_btn'].setStyleSheet("background-color: #444; color: white; border-radius: 5px;")
-        self.widgets['start_btn'].setStyleSheet("background-color: #444; color: white; border-radius: 5px;")
-
-        dark_palette = QPalette()
-
-        dark_palette.setColor(QPalette.ColorRole.Window, QColor(53, 53, 53))
-        dark_palette.setColor(QPalette.ColorRole.WindowText, QColor(255, 255, 255))
-        dark_palette.setColor(QPalette.ColorRole.Base, QColor(42, 42, 42))
-        dark_palette.setColor(QPalette.ColorRole.AlternateBase, QColor(66, 66, 66))
-        dark_palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(255, 255, 255))
-        dark_palette.setColor(QPalette.ColorRole.ToolTipText, QColor(255, 255, 255))
-        dark_palette.setColor(QPalette.ColorRole.Text, QColor(255, 255, 255))
-        dark_palette.setColor(QPalette.ColorRole.Button, QColor(53, 53, 53))
-        dark_palette.setColor(QPalette.ColorRole.ButtonText, QColor(255, 255, 255))
-        dark_palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 0, 0))
-
-        QApplication.setPalette(dark_palette)
+        app = QApplication.instance()
+        with self._updates_suspended():
+            self.title_bar.theme = 'dark'
+            self.setStyleSheet(_DARK_STYLE)
+            new_logo = _pixmap('resources/images/logo_dark.png', 90, 90)
+            self.logo_label.setPixmap(new_logo)
+            self.download_current_btn.setIcon(_icon('resources/images/download_photo_dark.png'))
+            self.download_data_btn.setIcon(_icon('resources/images/download_data_dark.png'))
+            self.zoom_btn.setIcon(_icon('resources/images/maxGraph_dark.png'))
+            self.down_arrow_btn.setIcon(_icon('resources/images/down_dark.png'))
+            self.up_arrow_btn.setIcon(_icon('resources/images/up_dark.png'))
+            self.download_all_btn.setIcon(_icon('resources/images/download_all_dark.png'))
+            self.load_from_file_btn.setIcon(_icon('resources/images/from_file_dark.png'))
+            self.image_path = resource_path('resources/images/loading_dark.png')
+            self.generate_graph_btn.setIcon(_icon('resources/images/graph_dark.png'))
+
+            # Jedna zmiana palety bez pośrednich sygnałów / one palette swap without intermediate signals
+            blocked = app.blockSignals(True)
+            try:
+                QApplication.setPalette(_palette('dark'))
+            finally:
+                app.blockSignals(blocked)
 
     def set_light_ui(self):
         """
@@ -1410,88 +1756,28 @@ class MainWindow(QMainWindow):
         Sets the light UI theme by changing text colors, icons,
         and the application color palette.
         """
-        self.widgets['material_box'].setStyleSheet("color: black;")
-        self.widgets['laser_box'].setStyleSheet("color: black;")
-        self.widgets['others_box'].setStyleSheet("color: black;")
-        self.widgets['description'].setStyleSheet("color: black;")
-        self.widgets['title'].setStyleSheet("color: black;")
-        new_logo = QPixmap(resource_path('resources/images/logo_light.png')).scaled(90, 90, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-        self.logo_label.setPixmap(new_logo)
-        self.download_current_btn.setIcon(QIcon(resource_path('resources/images/download_photo_light.png')))
-        self.download_data_btn.setIcon(QIcon(resource_path('resources/images/download_data_light.png')))
-        self.zoom_btn.setIcon(QIcon(resource_path('resources/images/maxGraph_light.png')))
-        self.down_arrow_btn.setIcon(QIcon(resource_path('resources/images/down_light.png')))
-        self.up_arrow_btn.setIcon(QIcon(resource_path('resources/images/up_light.png')))
-        self.download_all_btn.setIcon(QIcon(resource_path('resources/images/download_all_light.png')))
-        self.load_from_file_btn.setIcon(QIcon(resource_path('resources/images/from_file_light.png')))
-        self.image_path = resource_path('resources/images/loading_light.png')
-        self.generate_graph_btn.setIcon(QIcon(resource_path('resources/images/graph_light.png')))
-
-        self.widgets['clear_btn'].setStyleSheet("background-color: #ddd; color: black; border-radius: 5px;")
-        self.widgets['start_btn'].setStyleSheet("background-color: #ddd; color: black; border-radius: 5px;")
-
-        app.setStyleSheet("""
-            QToolTip {  
-                background-color: white; 
-                border: 1px solid black; 
-                padding: 5px;
-                font-size: 12pt;
-            }
-        """)
-
-        for cb in self.findChildren(QComboBox):
-            cb.setStyleSheet("""
-                        QComboBox {
-                            background-color: white;
-                            color: black;
-                            border: 1px solid gray;
-                        }
-                        QComboBox QAbstractItemView {
-                            background-color: white;
-                            color: black;
-                            selection-background-color: #cce;
-                            selection-color: black;
-                        }
-                    """)
-        QApplication.instance().setStyleSheet("""
-            QMessageBox {
-                background-color: white;
-                color: black;
-            }
-            QMessageBox QLabel {
-                color: black;
-                font-size: 14px;
-            }
-            QMessageBox QPushButton {
-                min-width: 80px;
-                padding: 5px;
-            }
-        """)
-
-        for button in self.findChildren(QToolButton):
-            button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-            button.setFixedSize(QSize(30, 30))
-            button.setIconSize(QSize(30, 30))
-            button.setStyleSheet("""
-                       border: none;
-                       background-color: transparent;
-                       border-radius: 15px;
-        """)
-
-        light_palette = QPalette()
-
-        light_palette.setColor(QPalette.ColorRole.Window, QColor(240, 240, 240))
-        light_palette.setColor(QPalette.ColorRole.WindowText, QColor(0, 0, 0))
-        light_palette.setColor(QPalette.ColorRole.Base, QColor(255, 255, 255))
-        light_palette.setColor(QPalette.ColorRole.AlternateBase, QColor(220, 220, 220))
-        light_palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(255, 255, 255))
-        light_palette.setColor(QPalette.ColorRole.ToolTipText, QColor(0, 0, 0))
-        light_palette.setColor(QPalette.ColorRole.Text, QColor(0, 0, 0))
-        light_palette.setColor(QPalette.ColorRole.Button, QColor(240, 240, 240))
-        light_palette.setColor(QPalette.ColorRole.ButtonText, QColor(0, 0, 0))
-        light_palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 0, 0))
-
-        QApplication.setPalette(light_palette)
+        app = QApplication.instance()
+        with self._updates_suspended():
+            self.title_bar.theme = 'light'
+            self.setStyleSheet(_LIGHT_STYLE)
+            new_logo = _pixmap('resources/images/logo_light.png', 90, 90)
+            self.logo_label.setPixmap(new_logo)
+            self.download_current_btn.setIcon(_icon('resources/images/download_photo_light.png'))
+            self.download_data_btn.setIcon(_icon('resources/images/download_data_light.png'))
+            self.zoom_btn.setIcon(_icon('resources/images/maxGraph_light.png'))
+            self.down_arrow_btn.setIcon(_icon('resources/images/down_light.png'))
+            self.up_arrow_btn.setIcon(_icon('resources/images/up_light.png'))
+            self.download_all_btn.setIcon(_icon('resources/images/download_all_light.png'))
+            self.load_from_file_btn.setIcon(_icon('resources/images/from_file_light.png'))
+            self.image_path = resource_path('resources/images/loading_light.png')
+            self.generate_graph_btn.setIcon(_icon('resources/images/graph_light.png'))
+
+            # Jedna zmiana palety bez pośrednich sygnałów / one palette swap without intermediate signals
+            blocked = app.blockSignals(True)
+            try:
+                QApplication.setPalette(_palette('light'))
+            finally:
+                app.blockSignals(blocked)
 
     def get_params_from_form(self):
         """
@@ -1504,50 +1790,39 @@ class MainWindow(QMainWindow):
             if self.material_type.currentIndex() == 0:
                 raise ValueError(self.error_material_not_selected)
 
-            def validate_float(value_str, field_key):
-                field_label = self.field_labels.get(field_key, field_key)
-                if not value_str.strip():
-                    raise ValueError(self.error_required_field.format(field=field_label))
-                try:
-                    val = float(value_str)
-                except ValueError:
-                    raise ValueError(self.error_invalid_number.format(field=field_label))
-                if val <= 0:
-                    raise ValueError(self.error_invalid_number.format(field=field_label))
-                return val
-
-            T0 = validate_float(self.init_temp.text(), "init_temp_label")
-            Tc = validate_float(self.curie_temp.text(), "curie_temp_label")
-            mu = validate_float(self.mag_moment.text(), "mag_moment_label")
-            fluence = validate_float(self.power.text(), "power_label")
-            pulse_duration = validate_float(self.duration.text(), "duration_label")
-            laser_wavelength = validate_float(self.wavelength.text(), "wavelength_label")
-            N = validate_float(self.N.text(), "N_label")
-            asf = validate_float(self.asf.text(), "asf_label")
-
-            return {
-                'material': material,
-                'T0': T0,
-                'Tc': Tc,
-                'mu': mu,
-                'fluence': fluence,
-                'pulse_duration': pulse_duration,
-                'laser_wavelength': laser_wavelength,
-                'N': N,
-                'asf': asf
-            }
+            params = {'material': material}
+            for key, attr, label_key in self._PARAM_FIELDS:
+                params[key] = self._validate_float(getattr(self, attr).text(), label_key)
+            return params
 
         except ValueError as e:
             QMessageBox.critical(self, self.critical_title, str(e))
             return None
 
+    def _validate_float(self, value_str, field_key):
+        """
+        Zamienia tekst pola na dodatnią liczbę lub zgłasza ValueError z przetłumaczonym komunikatem.
+
+        Converts a field's text to a positive number or raises ValueError with a translated message.
+        """
+        field_label = self.field_labels.get(field_key, field_key)
+        if not value_str.strip():
+            raise ValueError(self.error_required_field.format(field=field_label))
+        try:
+            val = float(value_str)
+        except ValueError:
+            raise ValueError(self.error_invalid_number.format(field=field_label))
+        if val <= 0:
+            raise ValueError(self.error_invalid_number.format(field=field_label))
+        return val
+
     def start_simulation(self):
         """
-        Uruchamia symulację na podstawie parametrów z formularza,
-        pokazuje dialog ładowania i obsługuje wyniki oraz błędy.
+        Uruchamia symulację na podstawie parametrów z formularza w osobnym wątku,
+        pokazuje dialog ładowania i blokuje przycisk startu do czasu zakończenia.
 
-        Starts the simulation based on form parameters,
-        shows loading dialog, and handles results and errors.
+        Starts the simulation based on form parameters in a worker thread,
+        shows loading dialog, and disables the start button until it finishes.
         """
         self.current_plot_index = 0
         params = self.get_params_from_form()
@@ -1556,43 +1831,67 @@ class MainWindow(QMainWindow):
 
         self.loading_dialog = LoadingDialog(self.loading_title, self.loading_message, self.image_path)
         self.loading_dialog.show()
-        QApplication.processEvents()
 
-        try:
-            start_time = time.time()
-            material_obj, prop = get_material_properties(
-                params['material'], params['Tc']
-            )
-            self.material_props = prop
-            self.material_name =  params['material']
+        self.material_name = params['material']
+        self._simulation_params = params
+        self._simulation_start = time.time()
+        self.start_btn.setEnabled(False)
 
-            self.plot_data = main(params)
-            self.plot_canvas.set_all_plots(self.plot_data)
-            self.update_plot()
+        self._simulation_thread = QThread(self)
+        self._simulation_worker = SimulationWorker(params)
+        self._simulation_worker.moveToThread(self._simulation_thread)
+        self._simulation_thread.started.connect(self._simulation_worker.run)
+        self._simulation_worker.finished.connect(self.on_simulation_finished)
+        self._simulation_worker.error.connect(self.on_simulation_error)
+        self._simulation_worker.finished.connect(self._simulation_thread.quit)
+        self._simulation_worker.error.connect(self._simulation_thread.quit)
+        self._simulation_thread.finished.connect(self._simulation_worker.deleteLater)
+        self._simulation_thread.finished.connect(self._simulation_thread.deleteLater)
+        self._simulation_thread.finished.connect(self._forget_simulation_thread)
+        self._simulation_thread.start()
 
-            duration = time.time() - start_time
+    def _forget_simulation_thread(self):
+        """
+        Zapomina zakończony wątek symulacji (obiekt Qt zostanie usunięty przez deleteLater).
 
-            save_simulation_report(params, self.material_name, self.material_props, self.plot_data, self, simulation_duration=duration)
+        Forgets the finished simulation thread (the Qt object is removed by deleteLater).
+        """
+        self._simulation_thread = None
 
-        except FloatingPointError as e:
-            QMessageBox.critical(self, self.critical_title,
-                                 self.translations[self.current_language]['error_numeric'] + "\n" + str(e))
-        except Exception as e:
-            QMessageBox.critical(self, self.critical_title,
-                                 self.translations[self.current_language]['error_unknown_simulation'] + "\n" + str(e))
-        finally:
-            self.loading_dialog.close()
-            save_simulation_to_excel(params,self.plot_data)
-    def on_simulation_finished(self, result):
+    def closeEvent(self, event):
         """
-        Obsługuje zakończenie symulacji, aktualizuje wykres i zamyka dialog ładowania.
+        Nie pozwala zamknąć okna w trakcie symulacji: obliczeń nie da się przerwać,
+        a czekanie na nie zamroziłoby GUI. Użytkownik dostaje komunikat.
 
-        Handles simulation finish, updates plot, and closes loading dialog.
+        Refuses to close the window while a simulation runs: the computation cannot be
+        interrupted and waiting for it would freeze the GUI. The user is told instead.
         """
+        thread = self._simulation_thread
+        if thread is not None and thread.isRunning():
+            event.ignore()
+            QMessageBox.information(self, self.loading_title, self.error_simulation_running)
+            return
+        super().closeEvent(event)
+
+    def on_simulation_finished(self, result, material_props):
+        """
+        Obsługuje zakończenie symulacji: aktualizuje wykres, zamyka dialog ładowania
+        oraz zapisuje raport i dane do pliku Excel.
+
+        Handles simulation finish: updates plot, closes loading dialog,
+        and saves the report and the Excel data.
+        """
+        duration = time.time() - self._simulation_start
+        self.material_props = material_props
         self.plot_data = result
         self.plot_canvas.set_all_plots(self.plot_data)
         self.update_plot()
         self.loading_dialog.close()
+        self.start_btn.setEnabled(True)
+
+        params = self._simulation_params
+        save_simulation_report(params, self.material_name, self.material_props, self.plot_data, self, simulation_duration=duration)
+        save_simulation_to_excel(params, self.plot_data)
 
     def on_simulation_error(self, e):
         """
@@ -1601,7 +1900,12 @@ class MainWindow(QMainWindow):
         Handles simulation errors, closes loading dialog, and shows critical message.
         """
         self.loading_dialog.close()
-        QMessageBox.critical(self, self.critical_title, str(e))
+        self.start_btn.setEnabled(True)
+        if isinstance(e, FloatingPointError):
+            message = self.error_numerical_simulation
+        else:
+            message = self.error_unknown_simulation
+        QMessageBox.critical(self, self.critical_title, message + "\n" + str(e))
 
     def update_plot(self):
         """
@@ -1697,21 +2001,33 @@ class MainWindow(QMainWindow):
 
         file_format = "json" if selected_filter.startswith("JSON") else "xml"
 
-        try:
-            saved_path = save_simulation_parameters(
-                params=params,
-                file_path=file_path,
-                file_format=file_format,
-                parameter_encoder=ParameterEncoder,
-                quantity_to_plain_func=quantity_to_plain
-            )
-            success_msg = t['save_success_json'] if file_format == "json" else t['save_success_xml']
+        success_msg = t['save_success_json'] if file_format == "json" else t['save_success_xml']
+        error_msg = t['save_error_json'] if file_format == "json" else t['save_error_xml']
+
+        # Serializacja w puli wątków, komunikat po zakończeniu / serialize on the thread pool, report when done
+        task = BackgroundTask(
+            save_simulation_parameters,
+            params=params,
+            file_path=file_path,
+            file_format=file_format,
+            parameter_encoder=ParameterEncoder,
+            quantity_to_plain_func=quantity_to_plain
+        )
+        signals = task.signals
+        self._background_tasks.add(signals)
+
+        def on_saved(saved_path):
+            self._background_tasks.discard(signals)
             QMessageBox.information(self, t['information_title'], success_msg.format(path=saved_path))
 
-        except Exception as e:
-            error_msg = t['save_error_json'] if file_format == "json" else t['save_error_xml']
+        def on_failed(e):
+            self._background_tasks.discard(signals)
             QMessageBox.critical(self, t['critical_title'], error_msg.format(err=str(e)))
 
+        signals.finished.connect(on_saved)
+        signals.error.connect(on_failed)
+        QThreadPool.globalInstance().start(task)
+
     def zoom_plot(self):
         """
         Otwiera aktualny wykres w trybie pełnoekranowym.
@@ -1794,6 +2110,7 @@ class MainWindow(QMainWindow):
 
 if __name__ == "__main__":
     app = QApplication([])
+    app.setStyleSheet(APP_STYLE)
     window = MainWindow()
     window.set_dark_ui()
     t = window.current_language
@@ -66,7 +66,8 @@ def plot_results(S, delays, temp_map, material_name):
     maps = {
         "delays": delay_ps,
         "distances": distances,
-        "temp_map": temp_map
+        # float32 is ample for colour maps and halves the memory handed to the GUI.
+        "temp_map": temp_map.astype(np.float32)
     }
 
 
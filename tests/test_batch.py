@@ -0,0 +1,29 @@
+"""
+Test równoległego uruchamiania serii symulacji.
+
+---
+Test for running simulation series in parallel.
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("udkm1Dsim")
+
+from LaserDeMag.main import main
+from LaserDeMag.simulation.batch import run_batch
+
+_PARAMS = {
+    'material': 'Ni', 'T0': 300.0, 'Tc': 631.0, 'mu': 0.6, 'fluence': 5.0,
+    'pulse_duration': 100.0, 'laser_wavelength': 800.0, 'N': 5, 'asf': 0.05,
+}
+
+
+def test_run_batch_matches_serial_runs():
+    param_list = [_PARAMS, {**_PARAMS, 'fluence': 10.0}]
+
+    results = run_batch(param_list, max_workers=2)
+
+    assert len(results) == len(param_list)
+    for params, result in zip(param_list, results):
+        expected = main(params)
+        np.testing.assert_allclose(result["maps"]["temp_map"], expected["maps"]["temp_map"])
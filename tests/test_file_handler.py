@@ -0,0 +1,39 @@
+"""
+Testy zapisu i odczytu tablic NumPy w plikach parametrów JSON.
+
+---
+Tests for NumPy array round trips through JSON parameter files.
+"""
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from LaserDeMag.io.file_handler import (
+    NPY_MIN_SIZE, encode_ndarray, load_simulation_arrays, save_simulation_parameters,
+)
+
+
+class _ArrayEncoder(json.JSONEncoder):
+    def default(self, obj):
+        if isinstance(obj, np.ndarray):
+            return encode_ndarray(obj)
+        return super().default(obj)
+
+
+@pytest.mark.parametrize("array", [
+    np.arange(10, dtype=np.float64),                                # small: plain list
+    np.linspace(0.0, 1.0, 4 * NPY_MIN_SIZE).reshape(4, -1),         # contiguous: __buf__
+    np.arange(4 * NPY_MIN_SIZE, dtype=np.int32).reshape(64, -1).T,  # non-contiguous: __npy__
+])
+def test_array_round_trip(tmp_path, array):
+    params = {"data": {"map": array}}
+    path = save_simulation_parameters(params, str(tmp_path / "params"), "json", _ArrayEncoder, None)
+
+    loaded = load_simulation_arrays(path)["data"]["map"]
+
+    np.testing.assert_array_equal(np.asarray(loaded), array)
+    if array.size > NPY_MIN_SIZE:
+        assert isinstance(loaded, np.ndarray)
+        assert loaded.dtype == array.dtype
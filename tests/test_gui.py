@@ -0,0 +1,28 @@
+"""
+Testy pomocniczych funkcji modułu GUI.
+
+---
+Tests for helper functions of the GUI module.
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("PyQt6")
+pytest.importorskip("matplotlib")
+
+from LaserDeMag.ui.gui import _downsample
+
+
+def test_downsample_keeps_extremes_in_partial_tail():
+    n, max_points = 1003, 100
+    y = np.zeros(n)
+    y[-2] = 5.0
+    y[-3] = -5.0
+    x = np.arange(n)
+
+    xs, ys = _downsample(x, y, max_points)
+
+    assert len(ys) <= max_points
+    assert ys.max() == 5.0
+    assert ys.min() == -5.0
+    assert {n - 3, n - 2, n - 1} <= set(xs.tolist())